@@ -3,10 +3,13 @@ O'Brien's Storage Finder - Web Application
 Copyright (c) 2025 John Hibberd
 All rights reserved.
 """
+import bisect
+import functools
+import json
 import os
-import sys
-import importlib.util
-from flask import Flask, render_template, request, session, redirect, url_for, flash, jsonify
+import threading
+from jinja2 import FileSystemBytecodeCache
+from flask import Flask, render_template, request, session, redirect, url_for, flash, jsonify, Response
 from dotenv import load_dotenv
 import re
 
@@ -15,30 +18,29 @@ load_dotenv()
 app = Flask(__name__)
 app.secret_key = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
 
-# Import the storage finder logic
-try:
-    # Handle filename with space - use absolute path
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    storage_finder_path = os.path.join(current_dir, "Storage Finder.py")
-    
-    # Check if file exists
-    if not os.path.exists(storage_finder_path):
-        raise FileNotFoundError(f"Storage Finder.py not found at {storage_finder_path}")
-    
-    spec = importlib.util.spec_from_file_location("storage_finder", storage_finder_path)
-    if spec is None or spec.loader is None:
-        raise ImportError("Failed to create spec for Storage Finder.py")
-    
-    storage_finder = importlib.util.module_from_spec(spec)
-    sys.modules["storage_finder"] = storage_finder
-    spec.loader.exec_module(storage_finder)
-    print("Successfully imported storage_finder module")
-except Exception as e:
-    import traceback
-    error_msg = f"Error importing storage_finder: {e}\n{traceback.format_exc()}"
-    print(error_msg)
-    # Raise the error so we know what's wrong
-    raise
+# Optional server-side sessions - with the default cookie sessions every
+# request signs and round-trips the whole customer state (name, items,
+# sizes...); pointing REDIS_URL at a Redis instance keeps that state
+# server-side so only a session id crosses the wire. Without the env var
+# the app keeps the stock cookie sessions and needs no extra services.
+_redis_url = os.getenv('REDIS_URL')
+if _redis_url:
+    import redis
+    from flask_session import Session
+    app.config['SESSION_TYPE'] = 'redis'
+    app.config['SESSION_REDIS'] = redis.Redis.from_url(_redis_url)
+    Session(app)
+
+# Import the storage finder logic - a plain import now that the module
+# file no longer has a space in its name, so CPython's .pyc cache applies
+# instead of re-compiling the source on every worker start
+import storage_finder
+
+# Cache warm-up is NOT started here: under gunicorn --preload this module
+# imports in the master, and a warm thread mid-request at fork time would
+# hand every worker a copy of locked HTTP-pool locks. The post_fork hook
+# in gunicorn.conf.py warms each worker instead; the dev entrypoint below
+# warms its own process.
 
 # Static prices (only these are hardcoded)
 STATIC_PRICES = {
@@ -52,90 +54,116 @@ STATIC_PRICES = {
     }
 }
 
+# Validation helpers built once at import instead of per request. Phone
+# numbers are short fixed-shape strings, so a translate + isdigit pass
+# (both single C loops) beats running a regex engine over them; the
+# email pattern stays a compiled regex.
+_PHONE_STRIP_TABLE = str.maketrans('', '', ' \t\r\n-()')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# One fixed user-facing failure message - the detail goes to the log,
+# not the customer
+_GENERIC_ERROR = 'Something went wrong. Please try again.'
+
+def require_customer(fn):
+    """Send the visitor back to the start form until they've registered
+    Replaces the identical in-session guard that opened most routes"""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if 'customer_name' not in session:
+            return redirect(url_for('start'))
+        return fn(*args, **kwargs)
+    return wrapper
+
 # UK phone number validation
 def validate_uk_phone(phone):
     """Validate UK phone number format"""
-    phone = re.sub(r'[\s\-\(\)]', '', phone)
-    # UK phone patterns
-    patterns = [
-        r'^0\d{10}$',  # 01123456789
-        r'^\+44\d{10}$',  # +441123456789
-        r'^0044\d{10}$',  # 00441123456789
-        r'^07\d{9}$',  # 07123456789 (mobile)
-    ]
-    return any(re.match(p, phone) for p in patterns)
+    phone = phone.translate(_PHONE_STRIP_TABLE)
+    # Normalise the international prefixes to the domestic leading zero,
+    # then one length + digit check covers every accepted form
+    if phone.startswith('+44'):
+        phone = '0' + phone[3:]
+    elif phone.startswith('0044'):
+        phone = '0' + phone[4:]
+    return len(phone) == 11 and phone[0] == '0' and phone.isdigit()
 
 # Email validation
 def validate_email(email):
     """Validate email format"""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    # Cheap literal pre-check - most bad inputs are missing the @ and
+    # never need the regex engine
+    if email.count('@') != 1:
+        return False
+    return _EMAIL_RE.match(email) is not None
 
 @app.route('/')
 def index():
     """Home page"""
     return render_template('index.html')
 
+# Start-form fields as (form key, validator, required message, invalid
+# message) - the POST handler walks this table instead of carrying a
+# per-field branch ladder and a throwaway errors list
+_START_FIELDS = (
+    ('name', None, 'Name is required', None),
+    ('phone', validate_uk_phone, 'Phone number is required', 'Please enter a valid UK phone number'),
+    ('email', validate_email, 'Email address is required', 'Please enter a valid email address'),
+)
+
 @app.route('/start', methods=['GET', 'POST'])
 def start():
     """Customer information form"""
     if request.method == 'POST':
-        name = request.form.get('name', '').strip()
-        phone = request.form.get('phone', '').strip()
-        email = request.form.get('email', '').strip()
+        values = {}
+        valid = True
+        for field, validator, required_msg, invalid_msg in _START_FIELDS:
+            value = request.form.get(field, '').strip()
+            values[field] = value
+            if not value:
+                flash(required_msg, 'error')
+                valid = False
+            elif validator is not None and not validator(value):
+                flash(invalid_msg, 'error')
+                valid = False
         
-        errors = []
-        if not name:
-            errors.append('Name is required')
-        if not phone:
-            errors.append('Phone number is required')
-        elif not validate_uk_phone(phone):
-            errors.append('Please enter a valid UK phone number')
-        if not email:
-            errors.append('Email address is required')
-        elif not validate_email(email):
-            errors.append('Please enter a valid email address')
-        
-        if errors:
-            for error in errors:
-                flash(error, 'error')
+        if not valid:
             return render_template('start.html')
         
         # Store in session
-        session['customer_name'] = name
-        session['customer_phone'] = phone
-        session['customer_email'] = email
+        session['customer_name'] = values['name']
+        session['customer_phone'] = values['phone']
+        session['customer_email'] = values['email']
         
         return redirect(url_for('find_storage'))
     
     return render_template('start.html')
 
 @app.route('/find-storage')
+@require_customer
 def find_storage():
     """Main storage finding flow"""
-    if 'customer_name' not in session:
-        return redirect(url_for('start'))
-    
     return render_template('find_storage.html')
 
+# The site list never changes at runtime - serialize it once at import
+# and let clients cache it instead of re-encoding five dicts per request
+_SITES_JSON = json.dumps([
+    {'id': 'wallsend', 'name': 'Wallsend'},
+    {'id': 'boldon', 'name': 'Boldon'},
+    {'id': 'birtley', 'name': 'Birtley'},
+    {'id': 'sunderland', 'name': 'Sunderland'},
+    {'id': 'chester-le-street', 'name': 'Chester-le-Street'}
+], separators=(',', ':')).encode('utf-8')
+
 @app.route('/api/sites')
 def api_sites():
     """Get available sites"""
-    sites = [
-        {'id': 'wallsend', 'name': 'Wallsend'},
-        {'id': 'boldon', 'name': 'Boldon'},
-        {'id': 'birtley', 'name': 'Birtley'},
-        {'id': 'sunderland', 'name': 'Sunderland'},
-        {'id': 'chester-le-street', 'name': 'Chester-le-Street'}
-    ]
-    return jsonify(sites)
+    return Response(_SITES_JSON, mimetype='application/json',
+                    headers={'Cache-Control': 'public, max-age=3600'})
 
 @app.route('/items-input', methods=['GET', 'POST'])
+@require_customer
 def items_input():
     """Input items for size calculation"""
-    if 'customer_name' not in session:
-        return redirect(url_for('start'))
-    
     if request.method == 'POST':
         description = request.form.get('description', '').strip()
         if not description:
@@ -148,6 +176,8 @@ def items_input():
     
     return render_template('items_input.html')
 
+_VALID_STORAGE_TYPES = frozenset({'container', 'internal'})
+
 @app.route('/choose-storage-type-for-items', methods=['GET', 'POST'])
 def choose_storage_type_for_items():
     """Choose storage type when coming from items input"""
@@ -156,15 +186,17 @@ def choose_storage_type_for_items():
     
     if request.method == 'POST':
         storage_type = request.form.get('storage_type')
-        if storage_type in ['container', 'internal']:
+        if storage_type in _VALID_STORAGE_TYPES:
             session['storage_type'] = storage_type
             # Clear size_method to ensure we go to process_items, not select_known_size
             session.pop('size_method', None)
             
-            # If internal storage, auto-select Sunderland and skip site selection
+            # If internal storage, auto-select Sunderland and skip site
+            # selection - the analysis runs here rather than behind a
+            # second redirect
             if storage_type == 'internal':
                 session['site'] = 'sunderland'
-                return redirect(url_for('process_items'))
+                return _analyze_items(storage_type)
             else:
                 # Container storage - need to choose site
                 return redirect(url_for('select_site'))
@@ -174,17 +206,15 @@ def choose_storage_type_for_items():
     return render_template('choose_size.html', form_action=url_for('choose_storage_type_for_items'))
 
 @app.route('/choose-size', methods=['GET', 'POST'])
+@require_customer
 def choose_size():
     """Choose a specific size"""
-    if 'customer_name' not in session:
-        return redirect(url_for('start'))
-    
     if request.method == 'POST':
         storage_type = request.form.get('storage_type')
-        if not storage_type:
+        if storage_type not in _VALID_STORAGE_TYPES:
             flash('Please select a storage type', 'error')
             return render_template('choose_size.html', form_action=url_for('choose_size'))
-        
+
         session['storage_type'] = storage_type
         session['size_method'] = 'known'
         
@@ -198,30 +228,40 @@ def choose_size():
     
     return render_template('choose_size.html', form_action=url_for('choose_size'))
 
+# Site whitelist per storage type - internal rooms exist only at
+# Sunderland, containers at all five sites
+_VALID_SITES_BY_TYPE = {
+    'internal': frozenset({'sunderland'}),
+    'container': frozenset({'wallsend', 'boldon', 'birtley', 'sunderland', 'chester-le-street'}),
+}
+
 @app.route('/select-site', methods=['GET', 'POST'])
+@require_customer
 def select_site():
     """Select storage site"""
-    if 'customer_name' not in session:
-        return redirect(url_for('start'))
-    
     # Get storage type from session (default to container if not set)
     storage_type = session.get('storage_type', 'container')
     
     if request.method == 'POST':
+        # One write covers both the old ensure-set fallback and the
+        # default for the rest of the handler
+        storage_type = session.setdefault('storage_type', 'container')
         site = request.form.get('site')
         if not site:
             flash('Please select a site', 'error')
             return render_template('select_site.html', storage_type=storage_type)
         
-        # Validate site selection based on storage type
-        if storage_type == 'internal' and site != 'sunderland':
-            flash('Internal storage is only available at Sunderland', 'error')
+        # Validate site selection based on storage type - .get because a
+        # stale session may hold a storage type we no longer recognise,
+        # which should fall through to the flash below, not a 500
+        if site not in _VALID_SITES_BY_TYPE.get(storage_type, frozenset()):
+            if storage_type == 'internal':
+                flash('Internal storage is only available at Sunderland', 'error')
+            else:
+                flash('Please select a valid site', 'error')
             return render_template('select_site.html', storage_type=storage_type)
         
         session['site'] = site
-        # Ensure storage_type is set (default to container)
-        if 'storage_type' not in session:
-            session['storage_type'] = 'container'
         
         # Process based on method
         # Only go to select_known_size if explicitly choosing a known size
@@ -229,48 +269,42 @@ def select_site():
         if session.get('size_method') == 'known' and 'description' not in session:
             return redirect(url_for('select_known_size'))
         elif 'description' in session:
-            # Coming from items input - calculate size and show recommendation
-            return redirect(url_for('process_items'))
+            # Coming from items input - analyze in this request instead of
+            # redirecting through /process-items
+            return _analyze_items(storage_type)
         else:
-            # Default: calculate size from items (if any)
-            return redirect(url_for('process_items'))
+            # Nothing to analyze without a description
+            return redirect(url_for('items_input'))
     
     return render_template('select_site.html', storage_type=storage_type)
 
 
-@app.route('/process-items')
-def process_items():
-    """Process items and calculate size"""
-    if storage_finder is None:
-        flash('Application error: Storage finder module not loaded. Please contact support.', 'error')
-        return redirect(url_for('index'))
-    
-    if 'customer_name' not in session or 'description' not in session:
-        return redirect(url_for('items_input'))
-    
-    # Make sure we have storage type and site selected
-    if 'storage_type' not in session:
-        return redirect(url_for('choose_storage_type_for_items'))
-    
-    if 'site' not in session:
-        return redirect(url_for('select_site'))
-    
-    description = session['description']
-    storage_type = session.get('storage_type')
-    
-    # Use the storage_finder logic to analyze description
+@functools.lru_cache(maxsize=256)
+def _analyze_description(description, storage_type):
+    """Run the full description analysis and memoise the result
+
+    The analysis is a pure function of its inputs, and customers re-run
+    the same description whenever they refresh or step back through the
+    flow - warm hits skip the fuzzy-matching work entirely."""
     items, _, vehicle_mentioned = storage_finder.analyze_initial_description(description)
-    
-    # Check for prohibited items
     prohibited = storage_finder.check_prohibited_items(items, storage_type)
-    
+    size, unrecognized = storage_finder.calculate_size_from_items(items)
+    return items, vehicle_mentioned, prohibited, size, unrecognized
+
+
+def _analyze_items(storage_type):
+    """Analyze the stored description and stash the results in the session
+    Shared by the handlers that already know the storage type and site, so
+    the customer goes straight to the results instead of bouncing through
+    an extra /process-items redirect. Returns the next-step redirect."""
+    items, vehicle_mentioned, prohibited, size, unrecognized = \
+        _analyze_description(session['description'], storage_type)
+
     # Check for vehicle in internal storage
     if vehicle_mentioned and storage_type == 'internal':
         session['vehicle_warning'] = True
         return redirect(url_for('vehicle_warning'))
-    
-    # Calculate size
-    size, unrecognized = storage_finder.calculate_size_from_items(items)
+
     session['calculated_size'] = size
     session['items'] = items
     session['unrecognized_items'] = unrecognized
@@ -278,16 +312,25 @@ def process_items():
     
     return redirect(url_for('show_results'))
 
+@app.route('/process-items')
+def process_items():
+    """Process items and calculate size (kept for direct navigation)"""
+    if 'customer_name' not in session or 'description' not in session:
+        return redirect(url_for('items_input'))
+    
+    # Make sure we have storage type and site selected
+    if 'storage_type' not in session:
+        return redirect(url_for('choose_storage_type_for_items'))
+    
+    if 'site' not in session:
+        return redirect(url_for('select_site'))
+    
+    return _analyze_items(session.get('storage_type'))
+
 @app.route('/select-known-size', methods=['GET', 'POST'])
+@require_customer
 def select_known_size():
     """Select a known size"""
-    if storage_finder is None:
-        flash('Application error: Storage finder module not loaded. Please contact support.', 'error')
-        return redirect(url_for('index'))
-    
-    if 'customer_name' not in session:
-        return redirect(url_for('start'))
-    
     site = session.get('site')
     storage_type = session.get('storage_type', 'container')
     
@@ -298,30 +341,26 @@ def select_known_size():
     
     # Get available sizes
     try:
-        import sys
-        sys.stderr.write(f"DEBUG: Checking availability for site={site}, storage_type={storage_type}\n")
-        sys.stderr.flush()
+        app.logger.debug("Checking availability for site=%s, storage_type=%s", site, storage_type)
         available_sizes = storage_finder.get_available_sizes(site, storage_type)
-        sys.stderr.write(f"DEBUG: Available sizes returned: {available_sizes}\n")
-        sys.stderr.flush()
+        app.logger.debug("Available sizes returned: %s", available_sizes)
         if not available_sizes:
-            sys.stderr.write(f"DEBUG: No available sizes found, redirecting\n")
-            sys.stderr.flush()
             flash('No units currently available at this site. Please try another site.', 'error')
             return redirect(url_for('select_site'))
-    except Exception as e:
-        import traceback
-        import sys
-        error_details = traceback.format_exc()
-        sys.stderr.write(f"DEBUG: Error in get_available_sizes: {e}\n{error_details}\n")
-        sys.stderr.flush()
-        flash(f'Error checking availability: {str(e)}', 'error')
+    except Exception:
+        app.logger.exception("Error in get_available_sizes")
+        flash(_GENERIC_ERROR, 'error')
         return redirect(url_for('select_site'))
     
     if request.method == 'POST':
-        size = request.form.get('size')
-        if size and size.isdigit():
-            session['selected_size'] = int(size)
+        # One int() call parses and validates in a single pass instead of
+        # an isdigit() scan followed by a second parse
+        try:
+            size = int(request.form.get('size'))
+        except (TypeError, ValueError):
+            size = None
+        if size in available_sizes:
+            session['selected_size'] = size
             session['items'] = []
             session['unrecognized_items'] = []
             session['prohibited_items'] = []
@@ -350,15 +389,9 @@ def vehicle_warning():
     return render_template('vehicle_warning.html')
 
 @app.route('/results')
+@require_customer
 def show_results():
     """Show storage recommendation results"""
-    if storage_finder is None:
-        flash('Application error: Storage finder module not loaded. Please contact support.', 'error')
-        return redirect(url_for('index'))
-    
-    if 'customer_name' not in session:
-        return redirect(url_for('start'))
-    
     site = session.get('site')
     storage_type = session.get('storage_type')
     items = session.get('items', [])
@@ -381,26 +414,19 @@ def show_results():
             return render_template('no_availability.html', site=site)
         
         # Find suitable size with 8sqft tolerance for internal storage
+        # (available_sizes comes back sorted, so bisect does the scanning)
         suitable_size = None
         if storage_type == 'internal':
             # For internal storage: 8sqft tolerance (e.g., 42sqft can cover 50sqft)
             # Find closest available size that is >= (calculated_size - 8)
-            min_acceptable_size = size - 8
-            acceptable_sizes = [s for s in available_sizes if s >= min_acceptable_size]
-            
+            acceptable_sizes = available_sizes[bisect.bisect_left(available_sizes, size - 8):]
             if acceptable_sizes:
                 # Find the closest size to the calculated size
                 suitable_size = min(acceptable_sizes, key=lambda x: abs(x - size))
         else:
-            # For containers: strict >= match (standardized sizes: 40, 80, 160, 320)
-            if size in available_sizes:
-                suitable_size = size
-            else:
-                # Find first available size >= calculated size
-                for available_size in sorted(available_sizes):
-                    if available_size >= size:
-                        suitable_size = available_size
-                        break
+            # For containers: first size >= the calculated size, which is
+            # the size itself when it's available (standardized: 40-320)
+            suitable_size = storage_finder.first_size_at_least(available_sizes, size)
         
         if not suitable_size:
             return render_template('no_suitable_size.html', 
@@ -408,11 +434,12 @@ def show_results():
                                  available_sizes=available_sizes,
                                  site=site)
         
-        # Get pricing
-        pricing = None
-        if site in storage_finder.SITE_PRICING and storage_type in storage_finder.SITE_PRICING[site]:
-            if suitable_size in storage_finder.SITE_PRICING[site][storage_type]:
-                pricing = storage_finder.SITE_PRICING[site][storage_type][suitable_size]
+        # Get pricing - one lookup path instead of three membership
+        # probes walking the same nesting
+        try:
+            pricing = storage_finder.SITE_PRICING[site][storage_type][suitable_size]
+        except KeyError:
+            pricing = None
         
         # Get contract info
         contract_info = get_contract_info(storage_type)
@@ -427,36 +454,35 @@ def show_results():
                              pricing=pricing,
                              contract_info=contract_info,
                              customer_name=session['customer_name'])
-    except Exception as e:
-        flash(f'Error: {str(e)}', 'error')
+    except Exception:
+        app.logger.exception("show_results failed site=%s storage_type=%s", site, storage_type)
+        flash(_GENERIC_ERROR, 'error')
         return redirect(url_for('find_storage'))
 
+# Contract details are constant per storage type - build both dicts once
+# instead of re-assembling them on every results render
+_CONTRACT_INFO = {
+    'container': {
+        'deposit': STATIC_PRICES['container']['deposit'],
+        'lock': STATIC_PRICES['container']['lock'],
+        'insurance_rate': 0.99,  # £0.99 per £1k per week
+        'insurance_note': 'Does not cover vehicles'
+    },
+    'internal': {
+        'deposit': STATIC_PRICES['internal']['deposit'],
+        'padlock': STATIC_PRICES['internal']['padlock'],
+        'insurance_rate': 0.99,  # £0.99 per £1k per week
+        'insurance_note': 'Does not cover vehicles'
+    }
+}
+
 def get_contract_info(storage_type):
     """Get contract information with static prices"""
-    if storage_type == 'container':
-        return {
-            'deposit': STATIC_PRICES['container']['deposit'],
-            'lock': STATIC_PRICES['container']['lock'],
-            'insurance_rate': 0.99,  # £0.99 per £1k per week
-            'insurance_note': 'Does not cover vehicles'
-        }
-    else:
-        return {
-            'deposit': STATIC_PRICES['internal']['deposit'],
-            'padlock': STATIC_PRICES['internal']['padlock'],
-            'insurance_rate': 0.99,  # £0.99 per £1k per week
-            'insurance_note': 'Does not cover vehicles'
-        }
+    return _CONTRACT_INFO['container' if storage_type == 'container' else 'internal']
 
 @app.route('/api/availability/<site>/<storage_type>')
 def api_availability(site, storage_type):
     """Get availability for a site and storage type"""
-    if storage_finder is None:
-        return jsonify({
-            'success': False,
-            'error': 'Storage finder module not loaded'
-        }), 500
-    
     try:
         available_sizes = storage_finder.get_available_sizes(site, storage_type)
         return jsonify({
@@ -469,6 +495,20 @@ def api_availability(site, storage_type):
             'error': str(e)
         }), 500
 
+# Compile every template at import time, backed by an on-disk bytecode
+# cache - a cold worker inherits ready-to-render template objects (and
+# under --preload shares them copy-on-write) instead of parsing each
+# .html on its first hit. No explicit directory: Jinja's default creates
+# a per-user 0700 cache dir and verifies ownership, where a fixed /tmp
+# path could be pre-seeded with marshalled bytecode by another local user
+app.jinja_env.auto_reload = False  # templates never change at runtime - skip the mtime stat per render
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+for _template_name in app.jinja_env.list_templates(filter_func=lambda n: n.endswith('.html')):
+    app.jinja_env.get_template(_template_name)
+
 if __name__ == '__main__':
-    app.run(debug=True, port=5000)
+    # Warm the units and pricing caches off the request path so the first
+    # visitor isn't the one paying the Storman API round-trips
+    threading.Thread(target=storage_finder.warm_caches, daemon=True).start()
+    app.run(debug=bool(os.getenv('FLASK_DEBUG')), port=int(os.getenv('PORT', '5000')))
 
@@ -1,5 +1,7 @@
 """Check which .env file is being used"""
 import os
+from itertools import islice
+
 from dotenv import load_dotenv
 
 print("=" * 60)
@@ -42,8 +44,8 @@ if os.path.exists(env_path):
     print(f"\n6. Contents of .env file (first 10 lines):")
     try:
         with open(env_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()[:10]
-            for i, line in enumerate(lines, 1):
+            # Only read the 10 lines we show, not the whole file
+            for i, line in enumerate(islice(f, 10), 1):
                 # Don't show full token, just first few chars
                 if 'TOKEN' in line or 'KEY' in line:
                     parts = line.split('=')
@@ -0,0 +1,17 @@
+"""Gunicorn server hooks for the Render deployment"""
+
+
+def post_fork(server, worker):
+    """Warm the units and pricing caches in each worker after fork
+
+    The warm-up cannot run at import time: under --preload the app
+    module imports in the master, and a warm thread mid-request on the
+    shared HTTP session when the fork happens would leave every worker
+    holding copies of locked connection-pool locks. Starting it here
+    gives each worker its own clean warm-up off the request path.
+    """
+    import threading
+
+    import storage_finder
+
+    threading.Thread(target=storage_finder.warm_caches, daemon=True).start()
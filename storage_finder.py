@@ -0,0 +1,1952 @@
+"""
+O'Brien's Storage Finder
+Copyright (c) 2025 John Hibberd
+All rights reserved.
+
+This software is proprietary and confidential.
+Unauthorized copying, distribution, or use is strictly prohibited.
+"""
+
+import bisect
+import logging
+import os
+import pickle
+import re
+import difflib
+import requests
+import sys
+import threading
+import time
+import webbrowser
+from dotenv import load_dotenv
+from collections import defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+import math
+
+load_dotenv()
+
+BASE_URL = "https://clouduk.storman.com"
+TOKEN = os.getenv("STORMAN_API_TOKEN")
+
+# Verbose diagnostics are opt-in - call sites check DEBUG first so release
+# runs skip the f-string formatting as well as the write itself
+# Diagnostics go through logging so they can be filtered (or piped as
+# structured output) without touching the user-facing prints; %s-style
+# arguments defer formatting until a handler actually wants the record
+log = logging.getLogger("storage_finder")
+
+DEBUG = os.getenv("STORAGE_FINDER_DEBUG") == "1"
+
+def _debug(message):
+    sys.stderr.write(message + "\n")
+    sys.stderr.flush()
+
+# Check if TOKEN is set
+if not TOKEN:
+    sys.stderr.write("WARNING: STORMAN_API_TOKEN environment variable is not set!\n")
+    sys.stderr.write("Please set STORMAN_API_TOKEN in Render's environment variables.\n")
+    sys.stderr.flush()
+
+HEADERS = {
+    "Authorization": f"Bearer {TOKEN}" if TOKEN else "Bearer ",
+    "Accept": "application/json"
+}
+
+# Shared session with keep-alive so repeated API calls reuse the same
+# TCP/TLS connection instead of paying a full handshake every time
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", requests.adapters.HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=requests.adapters.Retry(total=2, backoff_factor=0.2)
+))
+
+# (connect, read) timeouts so a hung connection can't stall the finder
+REQUEST_TIMEOUT = (3, 10)
+
+FACILITY_CODES = {
+    "container": "OBRIC",
+    "internal": "OBRIE"
+}
+
+# LIVE PRICING SYSTEM - All pricing and availability fetched from API in real-time
+# Pricing will be calculated dynamically from API data only
+# Weekly prices calculated as: (monthly × 12) ÷ 52
+# NO FALLBACK PRICING - System uses only live API data
+# defaultdict removes the per-site "if site not in SITE_PRICING" guards;
+# membership tests still behave like a plain dict
+SITE_PRICING = defaultdict(dict)
+
+VALID_SITES = ["wallsend", "boldon", "birtley", "sunderland", "chester-le-street"]
+
+SITE_PREFIXES = {
+    "birtley": ["BIR-", "B2-", "B3-"],
+    "boldon": ["BOL-", "BOL2-", "BOL3-"],
+    "wallsend": ["WAL-", "W-"],
+    "sunderland": ["SUN-"],
+    "chester-le-street": ["CLS-"]
+}
+
+# Tuple form of the prefixes so str.startswith can test all of them in a
+# single C-level call instead of a Python loop per unit
+SITE_PREFIX_TUPLES = {site: tuple(prefixes) for site, prefixes in SITE_PREFIXES.items()}
+
+# Enhanced item volumes for UK general public
+ITEM_CUBIC_FEET = {
+    # Furniture
+    "sofa": 50, "2 seater sofa": 35, "3 seater sofa": 50, "4 seater sofa": 60,
+    "corner sofa": 70, "sofa bed": 55, "loveseat": 35, "armchair": 10,
+    "rocking chair": 12, "recliner chair": 20, "chaise longue": 25, 
+    "settee": 50, "couch": 50, "futon": 40,
+    
+    # Electronics & Appliances
+    "television": 10, "tv": 10, "telly": 10, "flat screen": 10,
+    "microwave": 8, "fridge": 65, "freezer": 65, "fridge freezer": 65,
+    "washing machine": 25, "washer": 25, "dryer": 25, "dishwasher": 25,
+    "dish washer": 25, "oven": 15, "cooker": 15, "hob": 5, "extractor": 3,
+    "printer": 8, "computer": 5, "laptop": 2, "desktop": 5,
+    
+    # Beds & Bedroom
+    "double bed": 60, "single bed": 40, "king bed": 70, "super king bed": 75,
+    "bunk bed": 65, "bed frame": 30, "mattress": 40, "bedside table": 8,
+    "wardrobe": 45, "chest of drawers": 20, "dressing table": 25,
+    "mirror": 5, "full length mirror": 8,
+    
+    # Storage & Boxes
+    "box": 3, "small box": 1.5, "medium box": 3, "large box": 4.5,
+    "extra-large box": 6, "wardrobe box": 10, "mirror box": 5,
+    "archive box": 3, "crate": 3, "suitcase": 8, "rucksack": 3,
+    "bin": 5, "storage box": 4, "plastic box": 4,
+    
+    # Tables & Chairs
+    "chair": 10, "dining chair": 8, "office chair": 12, "stool": 5,
+    "table": 20, "dining table": 30, "coffee table": 15, "side table": 8,
+    "kitchen table": 30, "dining table and chairs": 50, "desk": 25,
+    "work desk": 25, "office desk": 25,
+    
+    # Storage Furniture
+    "bookcase": 20, "bookshelf": 20, "filing cabinet": 15, "sideboard": 30,
+    "buffet": 30, "display cabinet": 25, "tv stand": 15, "tv cabinet": 15,
+    
+    # Transport
+    "bike": 30, "bicycle": 30, "motorbike": 120, "car": 150, "vehicle": 150,
+    "scooter": 40, "pushbike": 30, "mountain bike": 35, "quad bike": 100, "atv": 100,
+    "jet ski": 80, "jetski": 80,
+    
+    # Tools & Equipment
+    "tools": 3, "tool box": 4, "tool chest": 10, "lawn mower": 15,
+    "hedge trimmer": 10, "strimmer": 8, "garden tools": 5, "drill": 2,
+    "saw": 3, "hammer": 1, "screwdriver": 1, "wrench": 1,
+    
+    # Garden & Outdoor
+    "garden chair": 8, "garden table": 20, "shed": 60, "garden shed": 60,
+    "barbecue": 20, "bbq": 20, "planter": 12, "flower pot": 12,
+    "patio furniture": 30, "sun lounger": 15, "umbrella": 5,
+    
+    # Sports & Leisure
+    "surfboard": 12, "surf board": 12, "treadmill": 50, "exercise bike": 40,
+    "gym equipment": 30, "weights": 20, "yoga mat": 2, "tent": 15,
+    "camping gear": 20, "fishing gear": 10, "golf clubs": 8,
+    
+    # Books & Media
+    "books": 10, "book": 1, "magazines": 5, "dvds": 3, "cds": 2,
+    "records": 5, "vinyl": 5, "games": 3, "board games": 5,
+    
+    # Clothing & Textiles
+    "clothes": 15, "clothing": 15, "shoes": 5, "boots": 8, "bags": 3,
+    "rug": 10, "carpet": 10, "curtains": 5, "bedding": 8, "towels": 3,
+    "duvet": 5, "pillow": 2, "blanket": 4,
+    
+    # Kitchen & Dining
+    "pots": 8, "pans": 8, "crockery": 5, "plates": 3, "cups": 2,
+    "glasses": 2, "cutlery": 2, "kitchen utensils": 5, "blender": 3,
+    "toaster": 3, "kettle": 2, "coffee machine": 5,
+    
+    # Miscellaneous
+    "ladder": 10, "step ladder": 8, "paint tins": 6, "paint": 6,
+    "cleaning supplies": 5, "vacuum cleaner": 8, "iron": 2, "fan": 5,
+    "heater": 5, "radiator": 8, "clock": 1, "picture": 2, "frame": 1,
+    "ornament": 1, "vase": 2, "plant": 3, "art": 5, "painting": 3
+}
+
+# Enhanced aliases for UK variations and common terms
+ALIASES = {
+    # TV variations
+    "tv": "television", "telly": "television", "flat screen": "television",
+    "smart tv": "television", "plasma": "television", "lcd": "television",
+    
+    # Fridge variations
+    "fridge": "fridge freezer", "freezer": "fridge freezer", 
+    "american fridge": "fridge freezer", "fridgefreezer": "fridge freezer",
+    
+    # Washing machine variations
+    "washer": "washing machine", "washing mashine": "washing machine", 
+    "washingmachin": "washing machine", "washing": "washing machine",
+    
+    # Dishwasher variations
+    "dish washer": "dishwasher", "dishwshr": "dishwasher", 
+    "dishwasing machine": "dishwasher", "dish": "dishwasher",
+    
+    # Box variations
+    "archive box": "box", "boxes": "box", "crate": "box", "cardboard box": "box",
+    "plastic box": "storage box", "storage boxes": "storage box",
+    
+    # Bookcase variations
+    "bookshelf": "bookcase", "book shelf": "bookcase", "book shelv": "bookcase",
+    "shelf": "bookcase", "shelves": "bookcase",
+    
+    # Sofa variations
+    "2 seater": "2 seater sofa", "two seater": "2 seater sofa",
+    "3 seater": "3 seater sofa", "three seater": "3 seater sofa",
+    "4 seater": "4 seater sofa", "four seater": "4 seater sofa", "4seater": "4 seater sofa",
+    "corner settee": "corner sofa", "corner": "corner sofa", "sectional": "corner sofa",
+    "couch": "3 seater sofa", "settee": "3 seater sofa", "loveseat": "loveseat",
+    
+    # Chair variations
+    "chair": "chair", "chairs": "chair", "arm chair": "armchair",
+    "dining chairs": "dining chair", "kitchen chair": "dining chair",
+    
+    # Table variations
+    "table": "table", "tables": "table", "kitchen table": "table",
+    "dinning table": "dining table", "dinning table and chairs": "dining table and chairs",
+    
+    # Bed variations
+    "bed": "double bed", "single": "single bed", "double": "double bed",
+    "king": "king bed", "super king": "super king bed", "bunk": "bunk bed",
+    "twin": "single bed", "queen": "king bed",
+    
+    # Tool variations
+    "toolbox": "tool box", "toolboxes": "tool box", "tool chest": "tool chest",
+    "tool kit": "tool box", "tools": "tools",
+    
+    # Surfboard variations
+    "surf board": "surfboard", "surfboards": "surfboard", "surf": "surfboard",
+    
+    # Garden tool variations
+    "mower": "lawn mower", "hedgeclipper": "hedge trimmer", "strimmer": "hedge trimmer",
+    "garden mower": "lawn mower", "grass cutter": "lawn mower",
+    
+    # Shed variations
+    "shed storage": "shed", "garden shed": "shed", "storage shed": "shed",
+    "workshop": "shed", "garden building": "shed",
+    
+    # Printer variations
+    "printer machine": "printer", "photocopier": "printer", "scanner": "printer",
+    
+    # Desk variations
+    "work desk": "desk", "office desk": "desk", "computer desk": "desk",
+    "study desk": "desk", "writing desk": "desk",
+    
+    # Filing variations
+    "filing drawers": "filing cabinet", "file cabinet": "filing cabinet",
+    "drawers": "filing cabinet", "filing": "filing cabinet",
+    
+    # Bookcase variations
+    "book shelves": "bookcase", "bookcases": "bookcase", "shelving": "bookcase",
+    
+    # TV stand variations
+    "tv cabinet": "tv stand", "tv stand unit": "tv stand", "tv unit": "tv stand",
+    "television stand": "tv stand", "media unit": "tv stand",
+    
+    # Coffee table variations
+    "coffee table": "coffee table", "side table": "coffee table", 
+    "end table": "coffee table", "occasional table": "coffee table",
+    
+    # Rug variations
+    "floor rug": "rug", "carpet": "rug", "mat": "rug", "runner": "rug",
+    
+    # Fan/Heater variations
+    "electric fan": "fan", "radiator": "heater", "heater unit": "heater",
+    "space heater": "heater", "portable heater": "heater",
+    
+    # Wardrobe variations
+    "ward robe": "wardrobe", "closet": "wardrobe", "built in wardrobe": "wardrobe",
+    "fitted wardrobe": "wardrobe", "walk in wardrobe": "wardrobe",
+    
+    # Sideboard variations
+    "side board": "sideboard", "buffet": "sideboard", "credenza": "sideboard",
+    
+    # Stool variations
+    "stools": "stool", "bar stool": "stool", "kitchen stool": "stool",
+    
+    # BBQ variations
+    "bbq": "barbecue", "barbeque": "barbecue", "grill": "barbecue",
+    
+    # Planter variations
+    "flower pot": "planter", "planters": "planter", "plant pot": "planter",
+    "garden pot": "planter", "flowerpot": "planter",
+    
+    # Paint variations
+    "paint cans": "paint tins", "paint bucket": "paint tins", "paint": "paint tins",
+    "paint pot": "paint tins", "emulsion": "paint tins",
+    
+    # Ladder variations
+    "step ladder": "step ladder", "stepladder": "step ladder", "ladder": "ladder",
+    "extension ladder": "ladder", "folding ladder": "step ladder",
+    
+    # Bike stand variations
+    "bike stand": "bicycle stand", "cycle rack": "bicycle stand", 
+    "bicycle rack": "bicycle stand", "bike rack": "bicycle stand",
+    
+    # Treadmill variations
+    "gym treadmill": "treadmill", "running machine": "treadmill", 
+    "exercise treadmill": "treadmill", "jogging machine": "treadmill",
+    
+    # Exercise bike variations
+    "exercise cycle": "exercise bike", "spinning bike": "exercise bike",
+    "stationary bike": "exercise bike", "indoor bike": "exercise bike",
+    
+    # Common UK terms
+    "hoover": "vacuum cleaner", "dustbin": "bin", "rubbish bin": "bin",
+    "wheelie bin": "bin", "bin bag": "bin", "rubbish": "bin",
+    "poster": "picture", "photo": "picture", "photograph": "picture",
+    "cushion": "pillow", "throw": "blanket", "bedspread": "blanket",
+    "duvet cover": "duvet", "sheet": "bedding", "bed sheets": "bedding",
+    "tea towel": "towels", "bath towel": "towels", "hand towel": "towels",
+    "mug": "cups", "cup": "cups", "glass": "glasses", "wine glass": "glasses",
+    "fork": "cutlery", "knife": "cutlery", "spoon": "cutlery",
+    "saucepan": "pots", "pan": "pans", "frying pan": "pans",
+    "plate": "plates", "bowl": "plates", "dish": "plates",
+    "clock": "clock", "watch": "clock", "alarm clock": "clock",
+    "ornament": "ornament", "decoration": "ornament", "figurine": "ornament",
+    "vase": "vase", "flower vase": "vase", "plant pot": "planter",
+    "plant": "plant", "house plant": "plant", "indoor plant": "plant",
+    "art": "art", "painting": "painting", "drawing": "art", "print": "art"
+}
+
+ALIASES = {k: v for k, v in ALIASES.items() if v in ITEM_CUBIC_FEET}
+
+# Intern the lookup keys - Python only auto-interns identifier-like
+# literals, so multi-word keys like "washing machine" otherwise pay a full
+# character comparison on every dict probe instead of a pointer check
+ITEM_CUBIC_FEET = {sys.intern(k): v for k, v in ITEM_CUBIC_FEET.items()}
+ALIASES = {sys.intern(k): sys.intern(v) for k, v in ALIASES.items()}
+
+# Fuzzy matching for misspelled items - rapidfuzz scores at C speed and is
+# far faster than difflib over the ~200 alias keys; fall back to difflib if
+# rapidfuzz isn't installed
+try:
+    from rapidfuzz import fuzz as _fuzz, process as _fuzz_process
+except ImportError:
+    _fuzz_process = None
+
+ALIAS_KEYS = list(ALIASES.keys())
+
+# Merged item/alias -> cubic feet table so a recognised name resolves with
+# a single dict lookup instead of an ALIASES hop followed by an
+# ITEM_CUBIC_FEET hop
+ALIAS_TO_CUFT = {**ITEM_CUBIC_FEET,
+                 **{alias: ITEM_CUBIC_FEET[target] for alias, target in ALIASES.items()}}
+
+# Splits a leading or trailing quantity from an item entry ("2 boxes" or
+# "boxes 2") in one compiled scan instead of split + per-word isdigit
+_QTY_RE = re.compile(r"^(?:(\d+)\s+)?(.+?)(?:\s+(\d+))?$")
+
+# 3-gram inverted index over the alias keys - lets the fuzzy matcher score
+# only the handful of keys sharing a trigram with the input instead of all
+# ~200 of them
+_TRIGRAM_INDEX = defaultdict(set)
+for _key in ALIAS_KEYS:
+    for _i in range(len(_key) - 2):
+        _TRIGRAM_INDEX[_key[_i:_i + 3]].add(_key)
+
+def _alias_candidates(item_name):
+    """Alias keys sharing at least one trigram with the item name"""
+    if len(item_name) < 3:
+        return ALIAS_KEYS
+    candidates = set()
+    for i in range(len(item_name) - 2):
+        candidates |= _TRIGRAM_INDEX.get(item_name[i:i + 3], set())
+    # A single mid-word typo can wipe out every trigram of a short word -
+    # fall back to scoring the full key list on that rare path rather
+    # than misfiling an item the scorer could still recover
+    return list(candidates) if candidates else ALIAS_KEYS
+
+def match_alias(item_name):
+    """Find the closest alias key for a misspelled item name, or None"""
+    candidates = _alias_candidates(item_name)
+    if _fuzz_process is not None:
+        match = _fuzz_process.extractOne(item_name, candidates, scorer=_fuzz.ratio, score_cutoff=80)
+        return match[0] if match else None
+    match = difflib.get_close_matches(item_name, candidates, n=1, cutoff=0.8)
+    return match[0] if match else None
+
+# Prohibited items by storage type
+PROHIBITED_ITEMS_CONTAINER = [
+    # Highly flammable items (containers only)
+    "vapes", "vape", "e-cigarette", "e-cig", "vapour", "vapor",
+    "fuel", "petrol", "diesel", "gas", "gasoline", "propane", "butane",
+    "flammable", "explosives", "fireworks", "batteries", "lithium",
+    "aerosol", "spray", "paint thinner", "solvent", "lighter fluid",
+    "white spirit", "turpentine", "acetone", "methanol", "ethanol",
+    "kerosene", "paraffin", "lamp oil", "camping fuel", "stove fuel"
+]
+
+PROHIBITED_ITEMS_INTERNAL = [
+    # Motor vehicles and large items (internal storage only)
+    "motorbike", "motorcycle", "car", "vehicle", "van", "truck", "lorry",
+    "scooter", "moped", "quad bike", "atv", "golf cart", "dirt bike",
+    "go kart", "go-kart", "jet ski", "jetski", "snowmobile", "snow mobile",
+    # Food and perishables (internal storage only)
+    "food", "perishable", "fresh food", "frozen food", "meat", "fish",
+    "dairy", "milk", "cheese", "yogurt", "fruit", "vegetables", "bread",
+    "canned food", "tinned food", "pantry items", "groceries",
+    # Plants (internal storage only)
+    "plant", "plants", "house plant", "indoor plant", "garden plant",
+    "flower", "flowers", "tree", "bush", "shrub", "cactus", "succulent",
+    "herb", "herbs", "seedling", "sapling", "potted plant"
+]
+
+# General prohibited items (both storage types)
+PROHIBITED_ITEMS_GENERAL = [
+    "tyres", "tires", "animals", "wildlife", "cigarettes", "illegal",
+    "stolen", "drugs", "weapons", "ammunition", "chemicals", "alcohol",
+    "wine", "beer", "spirits", "medication", "medicine", "prescription"
+]
+
+def _compile_keywords(words):
+    """Compile a keyword list into one substring-matching alternation"""
+    return re.compile("|".join(re.escape(w) for w in sorted(words, key=len, reverse=True)))
+
+# One compiled matcher per storage type - a single C-level scan of the item
+# replaces testing every prohibited keyword in a Python loop
+_PROHIBITED_RE = {
+    "container": _compile_keywords(PROHIBITED_ITEMS_CONTAINER + PROHIBITED_ITEMS_GENERAL),
+    "internal": _compile_keywords(PROHIBITED_ITEMS_INTERNAL + PROHIBITED_ITEMS_GENERAL)
+}
+
+# Motor vehicle keywords - excluding push bikes/bicycles
+MOTOR_VEHICLE_KEYWORDS = [
+    'car', 'motorbike', 'motorcycle', 'vehicle', 'van', 'truck', 'lorry', 'trailer',
+    'quad', 'quad bike', 'atv', 'all terrain vehicle', 'dirt bike', 'go kart', 'go-kart',
+    'jet ski', 'jetski', 'snowmobile', 'snow mobile', 'moped', 'scooter',
+    'petrol', 'gasoline', 'fuel', 'engine', 'motor'
+]
+
+# Compiled once so vehicle detection is one scan per description rather
+# than a Python loop over every keyword. NOTE: these keywords are matched
+# as substrings of free text, so converting the list to a set would not
+# help - the test is substring-in-string, not membership. Any new keyword
+# scan must join the words into a single regex like this, sorted longest
+# first so 'motorcycle' wins over 'motor', with word boundaries so 'car'
+# cannot match inside 'cardboard' - plus an optional trailing s so '2
+# cars' still counts as a vehicle mention
+_VEHICLE_RE = re.compile(
+    r'\b(?:' + '|'.join(re.escape(w) for w in sorted(set(MOTOR_VEHICLE_KEYWORDS), key=len, reverse=True)) + r')s?\b'
+)
+
+# Hoisted so get_facility_code doesn't rebuild this constant on every call
+_FACILITY_CODES_BY_SITE = {
+    "wallsend": {"container": "OBRIC", "internal": "OBRIC"},
+    "boldon": {"container": "OBRIC", "internal": "OBRIC"},
+    "birtley": {"container": "OBRIC", "internal": "OBRIC"},
+    "sunderland": {"container": "OBRIC", "internal": "OBRIE"},
+    "chester-le-street": {"container": "OBRIC", "internal": "OBRIC"}
+}
+
+def get_facility_code(site, storage_type):
+    """Get facility code for site and storage type"""
+    return _FACILITY_CODES_BY_SITE.get(site.lower(), {}).get(storage_type, "OBRIC")
+
+# Lightweight projection of the unit JSON the API returns - attribute
+# access on a namedtuple is cheaper than chained dict .get calls, and the
+# type code is lower-cased once here instead of by every consumer
+Unit = namedtuple('Unit', ['area', 'number', 'type_code', 'monthly', 'status'])
+
+def _project_units(raw_units):
+    """Project raw API unit dicts into Unit records"""
+    return [Unit(u.get('unit_area', 0) or 0,
+                 u.get('unit_number') or '',
+                 (u.get('unit_type_code') or '').lower(),
+                 u.get('rack_rate', 0) or 0,
+                 u.get('unit_status')) for u in raw_units]
+
+# Short-lived cache of unit listings per facility - avoids refetching the
+# same JSON payload from the API multiple times within a session
+_UNITS_CACHE = {}  # facility_code -> (timestamp, units)
+_UNITS_CACHE_TTL = 60  # seconds - availability is still near real-time
+
+def fetch_units_from_api(facility_code):
+    """Fetch all units from API (single call) - returns all units
+    Recent results are cached per facility for a short TTL so repeated
+    calls reuse the payload instead of paying another network round-trip"""
+    if not TOKEN:
+        sys.stderr.write("ERROR: STORMAN_API_TOKEN is not set. Cannot fetch units from API.\n")
+        sys.stderr.flush()
+        return []
+
+    cached = _UNITS_CACHE.get(facility_code)
+    if cached is not None:
+        timestamp, units = cached
+        if time.monotonic() - timestamp < _UNITS_CACHE_TTL:
+            return units
+
+    try:
+        res = SESSION.get(f"{BASE_URL}/api/v1/facility/{facility_code}/units", timeout=REQUEST_TIMEOUT)
+        if res.status_code == 200:
+            units = _project_units(res.json())
+            _UNITS_CACHE[facility_code] = (time.monotonic(), units)
+            return units
+    except Exception as e:
+        log.warning("Error fetching units from API: %s", e)
+    return []
+
+def warm_units_cache(facility_codes=None):
+    """Prefetch unit listings for several facilities in parallel
+    The fetches are independent network calls, so dispatching them through
+    a small thread pool overlaps the round-trips instead of paying them
+    one after another, and primes the units cache for later lookups"""
+    if facility_codes is None:
+        facility_codes = sorted(set(FACILITY_CODES.values()))
+    with ThreadPoolExecutor(max_workers=len(facility_codes)) as executor:
+        list(executor.map(fetch_units_from_api, facility_codes))
+
+def warm_caches():
+    """Prefetch units and container pricing for every site in the background
+    The cross-site scans and alternative-site prompts always want container
+    pricing for the full site list, so populate it up front while the
+    customer is still typing - the summaries run off the freshly warmed
+    units cache, so this is cheap after warm_units_cache has done the
+    network work"""
+    warm_units_cache()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for site in _FACILITY_CODES_BY_SITE:
+            executor.submit(get_pricing_from_api, site, "container")
+
+def get_available_units(facility_code, units=None):
+    """Get LIVE available units from the API - real-time availability only
+    If units are provided, uses those instead of making a new API call"""
+    if units is None:
+        units = fetch_units_from_api(facility_code)
+    
+    # Filter for available units only - API uses 'VACANT' status for available units
+    # This ensures only currently available units are shown
+    available_units = [unit for unit in units if unit.status == 'VACANT']
+    return available_units
+
+# Size-bucket mapping tables - a dict probe plus one compiled regex scan
+# replaces the old 4-8 sequential comparisons per unit
+_AREA_TO_SIZE = {40: 40, 80: 80, 160: 160, 320: 320}
+_UNIT_TYPE_RE = re.compile(r"(small|4x10|4x8)|(med|10x8)|(large|lge|20x8)|(xl|40x8|extra)")
+_TYPE_GROUP_SIZES = (40, 80, 160, 320)
+
+def _map_container_size(unit_area, unit_type):
+    """Map a container unit's area/type code to a standard size bucket"""
+    size = _AREA_TO_SIZE.get(unit_area)
+    if size is not None:
+        return size
+    # Not mapped by area - fall back to the unit type code
+    match = _UNIT_TYPE_RE.search(unit_type)
+    if match:
+        return _TYPE_GROUP_SIZES[match.lastindex - 1]
+    return None
+
+def canonical_size(unit):
+    """Standard container size bucket for a unit, or None if unrecognised"""
+    return _map_container_size(unit.area, unit.type_code)
+
+# Customer-facing labels for the standard container sizes - replaces the
+# repeated if/elif label chains scattered through the display code
+CONTAINER_SIZE_LABEL = {
+    40: "Small (4ft x 10ft - 40sqft)",
+    80: "Medium (10ft x 8ft - 80sqft)",
+    160: "Large (20ft x 8ft - 160sqft)",
+    320: "Extra Large (40ft x 8ft - 320sqft)",
+}
+
+# Wallsend's 2nd-month-free promotion applies to every size except the XL
+WALLSEND_PROMO_SIZES = frozenset((40, 80, 160))
+
+# (dimensions, display name) per standard container size - replaces the
+# duplicated dimension if/elif ladders in the vehicle-fit branches
+SIZE_SPECS = {
+    40: ("4x8x8", "Small"),
+    80: ("10x8x8", "Medium"),
+    160: ("20x8x8", "Large"),
+    320: ("40x8x8", "Extra Large"),
+}
+
+def _summarize_units(units, site, storage_type):
+    """Single pass over a facility's unit list collecting both the cheapest
+    pricing per size and the set of sizes with a VACANT unit
+    Fusing the two scans halves the iteration work compared with running
+    the pricing and availability loops separately"""
+    size_pricing = {}
+    available_sizes = set()
+    prefixes = SITE_PREFIX_TUPLES.get(site)
+
+    is_container = storage_type == "container"
+
+    for unit in units:
+        # Filter by site - containers use unit number prefixes, internal
+        # storage (Sunderland only) keeps every unit
+        if is_container:
+            if not (prefixes and unit.number.startswith(prefixes)):
+                continue
+            size_key = _map_container_size(unit.area, unit.type_code)
+        else:  # Internal storage uses the actual unit area
+            size_key = unit.area if unit.area > 0 else None
+        if size_key is None:
+            continue
+
+        # Track the cheapest price for each size
+        monthly_price = unit.monthly  # API's rack_rate, i.e. the monthly price
+        if monthly_price > 0:
+            prev = size_pricing.get(size_key)
+            if prev is None or monthly_price < prev['monthly']:
+                # Calculate weekly price using formula: (monthly × 12) ÷ 52
+                size_pricing[size_key] = {
+                    "weekly": round((monthly_price * 12) / 52, 2),
+                    "monthly": monthly_price
+                }
+
+        # API uses 'VACANT' status for currently available units
+        if unit.status == 'VACANT':
+            available_sizes.add(size_key)
+
+    # Bake the Wallsend container promotion in at build time so the
+    # display paths test one flag instead of re-deriving site + size
+    if is_container and site == "wallsend":
+        for size_key in WALLSEND_PROMO_SIZES & size_pricing.keys():
+            size_pricing[size_key]["promo"] = True
+
+    return size_pricing, available_sizes
+
+# Last-known-good pricing snapshot - lets a flaky API fall back to recent
+# prices instead of showing "no units available"
+_PRICING_SNAPSHOT_FILE = os.path.join(
+    os.getenv("STORAGE_FINDER_CACHE_DIR", os.path.expanduser("~")),
+    ".storage_finder_cache.pkl")
+_PRICING_SNAPSHOT_MAX_AGE = 86400  # 24 hours
+
+def _save_pricing_snapshot():
+    """Persist the current SITE_PRICING so API outages can reuse it"""
+    try:
+        with open(_PRICING_SNAPSHOT_FILE, 'wb') as f:
+            pickle.dump({'ts': time.time(), 'data': {s: dict(v) for s, v in SITE_PRICING.items()}}, f)
+    except Exception:
+        pass  # Snapshot is best-effort only
+
+def _load_pricing_snapshot(site, storage_type):
+    """Restore pricing for site/storage_type from a recent snapshot
+    Returns True if usable (stale-but-recent) pricing was restored"""
+    try:
+        with open(_PRICING_SNAPSHOT_FILE, 'rb') as f:
+            snapshot = pickle.load(f)
+        if time.time() - snapshot['ts'] < _PRICING_SNAPSHOT_MAX_AGE:
+            pricing = snapshot['data'].get(site, {}).get(storage_type)
+            if pricing:
+                SITE_PRICING[site][storage_type] = pricing
+                return True
+    except Exception:
+        pass
+    return False
+
+# Memoized pricing refresh outcomes - the units cache already makes repeat
+# calls network-free, this also skips re-summarising the same unit list
+# (the cross-site scans call get_pricing_from_api once per site)
+_PRICING_MEMO = {}  # (site, storage_type) -> (timestamp, result)
+_PRICING_MEMO_TTL = 30  # seconds
+
+def get_pricing_from_api(site, storage_type, units=None):
+    """Get LIVE pricing from API and calculate weekly prices dynamically - NO FALLBACK
+    This is an online pricing system - all prices fetched in real-time from API only
+    If units are provided, uses those instead of making a new API call"""
+    if not TOKEN:
+        sys.stderr.write("ERROR: STORMAN_API_TOKEN is not set. Cannot fetch pricing from API.\n")
+        sys.stderr.flush()
+        return False
+    try:
+        facility_code = FACILITY_CODES[storage_type]
+
+        # Only fetch from API if units not provided
+        if units is None:
+            memo = _PRICING_MEMO.get((site, storage_type))
+            if memo is not None and time.monotonic() - memo[0] < _PRICING_MEMO_TTL:
+                return memo[1]
+            units = fetch_units_from_api(facility_code)
+
+        if not units:
+            # API gave us nothing - fall back to the last good snapshot
+            return _load_pricing_snapshot(site, storage_type)
+
+        # Store the cheapest pricing for each size
+        size_pricing, _ = _summarize_units(units, site, storage_type)
+        SITE_PRICING[site][storage_type] = size_pricing
+
+        # Return True if we found pricing, False if no pricing available
+        result = len(size_pricing) > 0
+        if result:
+            _save_pricing_snapshot()
+        _PRICING_MEMO[(site, storage_type)] = (time.monotonic(), result)
+        return result
+
+    except Exception as e:
+        log.warning("Error fetching pricing from API: %s", e)
+        return _load_pricing_snapshot(site, storage_type)
+
+# Memoized size lists per (site, storage_type) - sits above the raw units
+# cache so repeat lookups skip even the summarisation pass
+_SIZES_CACHE = {}  # (site, storage_type) -> (timestamp, tuple of sizes)
+_SIZES_CACHE_TTL = 30  # seconds
+
+def invalidate_sizes_cache():
+    """Drop memoized size lists (e.g. after a forced pricing refresh)"""
+    _SIZES_CACHE.clear()
+
+def get_available_sizes(site, storage_type):
+    """Get LIVE available sizes for a specific site and storage type from API
+    Returns only sizes that are currently available - no fallback sizes
+    OPTIMIZED: ONE API call and ONE pass over the unit list covers both
+    pricing and availability; results are memoized for a short TTL"""
+    cache_key = (site, storage_type)
+    cached = _SIZES_CACHE.get(cache_key)
+    if cached is not None:
+        timestamp, sizes = cached
+        if time.monotonic() - timestamp < _SIZES_CACHE_TTL:
+            return list(sizes)
+
+    if DEBUG:
+        _debug(f"DEBUG get_available_sizes: site={site}, storage_type={storage_type}")
+
+    facility_code = FACILITY_CODES[storage_type]
+
+    units = fetch_units_from_api(facility_code)
+    if DEBUG:
+        _debug(f"DEBUG get_available_sizes: Fetched {len(units)} units from API (single call)")
+
+    # Summarise pricing and availability together in a single pass
+    size_pricing, available_sizes = _summarize_units(units, site, storage_type)
+
+    # Record the pricing summary so callers can read SITE_PRICING
+    SITE_PRICING[site][storage_type] = size_pricing
+
+    # Return only live availability from API - no fallback sizes
+    result = sorted(available_sizes)
+    _SIZES_CACHE[cache_key] = (time.monotonic(), tuple(result))
+    if DEBUG:
+        _debug(f"DEBUG get_available_sizes: returning {result}")
+    return result
+
+# Memoized cross-site scan results - a re-select loop turn that asks for
+# the same site list within the TTL reuses the previous scan outright
+_SCAN_MEMO = {}  # tuple of sites -> (timestamp, site_info list)
+_SCAN_MEMO_TTL = 30  # seconds - matches the pricing memo
+
+def _scan_container_sites(sites_to_check):
+    """Check several sites for available container units, in parallel
+
+    Each site costs two round-trips (units + pricing), so scanning the
+    sites one after another dominated the wait; a small thread pool
+    overlaps the network calls. Returns site_info dicts in the same
+    order as sites_to_check, skipping sites with nothing available.
+    Recent results are memoized so back-to-back re-select turns skip
+    even the summarisation work."""
+    memo_key = tuple(sites_to_check)
+    memo = _SCAN_MEMO.get(memo_key)
+    if memo is not None and time.monotonic() - memo[0] < _SCAN_MEMO_TTL:
+        return memo[1]
+
+    def check(check_site):
+        try:
+            # Get available units for containers at this site
+            available_units = get_available_units(get_facility_code(check_site, "container"))
+
+            # Filter units by site-specific prefixes
+            prefixes = SITE_PREFIX_TUPLES.get(check_site, ())
+            site_specific_units = [unit for unit in available_units
+                                   if unit.number.startswith(prefixes)] if prefixes else []
+
+            if site_specific_units:
+                # Get pricing for this site
+                pricing_success = get_pricing_from_api(check_site, "container")
+                if pricing_success and check_site in SITE_PRICING and "container" in SITE_PRICING[check_site]:
+                    return {
+                        'site': check_site.title(),
+                        'units': site_specific_units,
+                        'sizes': tuple(sorted({s for s in map(canonical_size, site_specific_units) if s})),
+                        'pricing': SITE_PRICING[check_site]["container"]
+                    }
+        except Exception as e:
+            log.warning("Error processing %s: %s", check_site, e)
+        return None
+
+    with ThreadPoolExecutor(max_workers=len(sites_to_check)) as executor:
+        results = executor.map(check, sites_to_check)
+    available_sites = [site_info for site_info in results if site_info]
+    _SCAN_MEMO[memo_key] = (time.monotonic(), available_sites)
+    return available_sites
+
+def closest_available_size(sorted_sizes, requested_size):
+    """Closest available size to the request - sorted input, bisect lookup
+    instead of a min() scan with a per-element lambda"""
+    i = bisect.bisect_left(sorted_sizes, requested_size)
+    neighbours = sorted_sizes[max(i - 1, 0):i + 1]
+    return min(neighbours, key=lambda s: abs(s - requested_size))
+
+def first_size_at_least(sorted_sizes, size):
+    """First available size >= the requirement, or None - sorted input"""
+    i = bisect.bisect_left(sorted_sizes, size)
+    return sorted_sizes[i] if i < len(sorted_sizes) else None
+
+def calculate_size_from_items(items_list):
+    # Collect per-item volumes and reduce once with the built-in sum() so
+    # the arithmetic runs at C speed instead of repeated interpreter adds
+    volumes = []
+    unrecognized_items = []
+
+    for entry in items_list:
+        entry = entry.strip().lower()
+
+        # Fast path: the whole entry is already a recognised item name with
+        # no quantity to parse, which is the common case
+        vol = ALIAS_TO_CUFT.get(entry)
+        if vol is not None:
+            volumes.append(vol)
+            continue
+
+        match = _QTY_RE.match(entry)
+        if match:
+            qty = int(match.group(1) or match.group(3) or 1)
+            item_name = match.group(2)
+        else:
+            qty = 1
+            item_name = entry
+
+        vol = ALIAS_TO_CUFT.get(item_name)
+        if vol is None:
+            match = match_alias(item_name)
+            if match:
+                vol = ALIAS_TO_CUFT[match]
+
+        if vol is not None:
+            volumes.append(vol * qty)
+        else:
+            unrecognized_items.append(entry)
+
+    total_cuft = sum(volumes)
+    size = max(20, round(total_cuft / 6))
+    return size, unrecognized_items
+
+def print_welcome():
+    print("=" * 70)
+    print("🏠 Welcome to O'Brien's Storage Finder! 🏠")
+    print("=" * 70)
+    print("Find available storage units in real-time across all our locations.")
+    print("Get instant pricing and availability for the perfect storage solution.")
+    print("=" * 70)
+
+def get_initial_response():
+    print("\nLet's find you the perfect storage solution!")
+    print("1. Find available storage (recommended)")
+    print("2. Account & invoice inquiry")
+    print("3. Exit")
+    
+    while True:
+        choice = input("\nEnter your choice (1-3): ").strip()
+        if choice in ['1', '2', '3']:
+            return choice
+        print("Please enter 1, 2, or 3.")
+
+def handle_account_inquiry():
+    print("\n" + "=" * 50)
+    print("📞 ACCOUNT & INVOICE INQUIRY")
+    print("=" * 50)
+    print("Please contact us between 8am – 5pm Monday to Friday")
+    print("Or please leave your name and number here and we will call you back.")
+    print("=" * 50)
+
+def get_storage_site():
+    print("\nWhere are you looking to store?")
+    print("We have sites in:")
+    print("1. Wallsend")
+    print("2. Boldon") 
+    print("3. Birtley")
+    print("4. Sunderland")
+    print("5. Chester-le-Street")
+    
+    site_map = {
+        '1': 'wallsend',
+        '2': 'boldon', 
+        '3': 'birtley',
+        '4': 'sunderland',
+        '5': 'chester-le-street'
+    }
+    
+    while True:
+        choice = input("\nEnter your choice (1-5): ").strip()
+        if choice in site_map:
+            return site_map[choice]
+        print("Please enter a number between 1 and 5.")
+
+def get_storage_type(site):
+    if site == "sunderland":
+        print("\nWhat type of storage are you looking for?")
+        print("1. Container storage (outdoor, 24/7 access)")
+        print("2. Internal storage (indoor, business hours)")
+        
+        while True:
+            choice = input("\nEnter your choice (1-2): ").strip()
+            if choice == '1':
+                return 'container'
+            elif choice == '2':
+                return 'internal'
+            print("Please enter 1 or 2.")
+    else:
+        return 'container'
+
+def get_customer_choice(storage_type):
+    print("\nDo you know what size you need, or would you like our recommendation?")
+    
+    if storage_type == "container":
+        print("1. I know what size I need (e.g., 10ft container, 20ft container, 40ft container, or 40sqft, 160sqft)")
+    else:  # internal storage
+        print("1. I know what size I need (e.g., 25sqft room, 50sqft room, 75sqft room)")
+    
+    print("2. I need help - recommend based on my items")
+    
+    while True:
+        choice = input("\nEnter your choice (1-2): ").strip()
+        if choice in ['1', '2']:
+            return choice
+        print("Please enter 1 or 2.")
+
+def get_known_size(site, storage_type):
+    # Get available sizes from API
+    available_sizes = get_available_sizes(site, storage_type)
+    
+    if not available_sizes:
+        print("⚠️  Currently no units available at this site.")
+        print("Please contact us directly for availability updates.")
+        return None
+    
+    if storage_type == "container":
+        print(f"\nWhat size container do you need?")
+        print("You can tell me the size in sqft (e.g., 40, 80, 160, 320) or describe it (e.g., small, medium, large, extra large).")
+        print("For container dimensions, you can also say: 10ft, 20ft, or 40ft container.")
+        
+        while True:
+            user_input = read_choice("\nWhat size do you need? ")
+            
+            # Try to parse numeric input
+            try:
+                requested_size = int(user_input)
+                # Find the closest available size
+                closest_size = closest_available_size(available_sizes, requested_size)
+                if closest_size == requested_size:
+                    print(f"✅ Perfect! We have {closest_size} sqft containers available.")
+                else:
+                    print(f"✅ We don't have exactly {requested_size} sqft, but we have {closest_size} sqft available.")
+                    if not yn(f"Would you like the {closest_size} sqft container? (y/n): "):
+                        continue
+                return closest_size
+            except ValueError:
+                # Handle descriptive input with enhanced container dimensions
+                size_mapping = {
+                    # Square footage
+                    'small': 40, 's': 40, '4x10': 40, '4ft': 40,
+                    'medium': 80, 'med': 80, 'm': 80, '10x8': 80, '8ft': 80,
+                    'large': 160, 'l': 160, '20x8': 160,
+                    'extra large': 320, 'xl': 320, 'extra': 320, '40x8': 320,
+                    # Container dimensions (most common way customers ask)
+                    '10ft': 40, '10 foot': 40, '10ft container': 40, '10 foot container': 40,
+                    '20ft': 160, '20 foot': 160, '20ft container': 160, '20 foot container': 160,
+                    '40ft': 320, '40 foot': 320, '40ft container': 320, '40 foot container': 320,
+                    # Additional variations
+                    'ten foot': 40, 'ten ft': 40, 'ten foot container': 40,
+                    'twenty foot': 160, 'twenty ft': 160, 'twenty foot container': 160,
+                    'forty foot': 320, 'forty ft': 320, 'forty foot container': 320
+                }
+                
+                if user_input in size_mapping:
+                    requested_size = size_mapping[user_input]
+                    closest_size = closest_available_size(available_sizes, requested_size)
+                    if closest_size == requested_size:
+                        print(f"✅ Perfect! We have {closest_size} sqft containers available.")
+                    else:
+                        print(f"✅ We don't have exactly {requested_size} sqft, but we have {closest_size} sqft available.")
+                        if not yn(f"Would you like the {closest_size} sqft container? (y/n): "):
+                            continue
+                    return closest_size
+                else:
+                    print("I didn't understand that. Please try again with:")
+                    print("• Square footage: '40', '80', '160', '320'")
+                    print("• Descriptions: 'small', 'medium', 'large', 'extra large'")
+                    print("• Container dimensions: '10ft', '20ft', '40ft'")
+    else:  # Internal storage
+        print(f"\nWhat size room do you need?")
+        print("You can tell me the size in sqft (e.g., 25, 35, 50, 75) and I'll recommend the closest available option.")
+        
+        while True:
+            user_input = read_choice("\nWhat size do you need? ")
+            
+            # Try to parse numeric input
+            try:
+                requested_size = int(user_input)
+                # Find the closest available size
+                closest_size = closest_available_size(available_sizes, requested_size)
+                if closest_size == requested_size:
+                    print(f"✅ Perfect! We have {closest_size} sqft rooms available.")
+                else:
+                    print(f"✅ We don't have exactly {requested_size} sqft, but we have {closest_size} sqft available.")
+                    if not yn(f"Would you like the {closest_size} sqft room? (y/n): "):
+                        continue
+                return closest_size
+            except ValueError:
+                print("I didn't understand that. Please try again with a size like '25', '35', '50', '75' etc.")
+
+# Static site-info banners, pre-joined once at import so display_site_info
+# emits each block with a single print. Only the security line varies by
+# site, so the container blurb is split around it
+CONTAINER_BLURB_TOP = "\n".join([
+    "🚛 CONVENIENT ACCESS",
+    "• Drive-up containers for easy loading and unloading – no trolleys, lifts, or corridors",
+    "• 24/7 direct access via car, van, or truck",
+    "• Flexible, pay-as-you-go contracts with refundable deposits",
+    "• Fixed pricing for 12 months – guaranteed",
+    "",
+    "🔒 SECURITY YOU CAN TRUST",
+    "• 24-hour monitored CCTV",
+])
+
+CONTAINER_BLURB_BOTTOM = "\n".join([
+    "• Gated entry with code access and ANPR",
+    "• Optional insurance and heavy-duty locks available",
+])
+
+INTERNAL_BLURB = "\n".join([
+    "📦 GOOD LIFT 2M X 2M",
+    "",
+    "🎯 YOUR PERSONALISED STORAGE PLAN INCLUDES:",
+    "• Private, Secure Rooms: Tailored to your individual needs",
+    "• Range of Sizes: Affordable options to suit your budget",
+    "• Monthly Billing: No confusing four-week cycles, just simple, straightforward payments",
+    "• Flexible Contracts: Includes refunds for any unused rental or insurance",
+    "• Price Guarantee for 12 Months: No unexpected increases, your price is locked in",
+    "• Professional, Personal Service: You're never just a number to us",
+    "• Free Trolley and Lift Use: Making access easy and efficient",
+    "",
+    "🔧 ADDITIONAL SERVICES AVAILABLE:",
+    "• Insurance Options: For added peace of mind",
+    "• Packing Materials: Available on-site for convenience",
+    "• Recommended Removals: Trusted local partners available",
+    "• Out-of-Hours Access: Available on request",
+    "• Collection & Delivery Service: Drop parcels with us for easy collection later",
+])
+
+# Final booking summary - the fixed framing is assembled once at import so
+# the confirmation path only fills in the chosen site and size
+SUMMARY_TEMPLATE = "\n".join([
+    "\n" + "=" * 50,
+    "📋 SUMMARY:",
+    "   Site: {site}",
+    "   Type: Container Storage",
+    "   Size: {size_name} ({dimensions})",
+    "   Vehicle storage: ✅ Allowed",
+    "=" * 50,
+    "\n👋 Thanks for using O'Brien's Storage Finder!",
+])
+
+def display_site_info(site, storage_type):
+    header = f"\n{'='*50}\n📍 {site.title()} - {storage_type.title()} Storage\n{'='*50}"
+
+    if storage_type == "container":
+        if site == "birtley":
+            security_line = "• On-site 24-hour Security presence by our Birtley Security team"
+        else:
+            security_line = "• Monitored by our local security team based in Birtley"
+        print("\n".join([header, CONTAINER_BLURB_TOP, security_line, CONTAINER_BLURB_BOTTOM]))
+    else:  # Internal storage (Sunderland)
+        print("\n".join([header, INTERNAL_BLURB]))
+    return True
+
+def display_pricing_info(site, storage_type, available_sizes):
+    """Display pricing information after we know the customer's needs"""
+    lines = [f"\n✅ Currently available sizes and pricing:"]
+
+    if storage_type == "container":
+        for size in available_sizes:
+            label = CONTAINER_SIZE_LABEL.get(size)
+            if label is None:
+                continue
+            pricing = SITE_PRICING[site]['container'][size]
+            if pricing.get("promo"):
+                lines.append(f"• {label} - £18 a week inc VAT with 2nd month free promotion (£{pricing['monthly']} per month)")
+            else:
+                lines.append(f"• {label} - £{pricing['weekly']} a week inc VAT (£{pricing['monthly']} per month)")
+
+        if site == "wallsend":
+            lines.append("\n🎉 SPECIAL OFFER: 2nd month free promotion - equates to £18 per week!")
+
+    else:  # Internal storage (Sunderland)
+        for size in available_sizes:
+            if size in SITE_PRICING['sunderland']['internal']:
+                pricing = SITE_PRICING['sunderland']['internal'][size]
+                half_weekly = pricing['weekly'] / 2
+                half_monthly = pricing['monthly'] / 2
+                lines.append(f"• {size} sqft room (8ft tall) - £{half_weekly:.2f} a week inc VAT (£{half_monthly:.2f} per month) for the 1st 2 months, £{pricing['weekly']} a week inc VAT (£{pricing['monthly']} per month) thereafter")
+
+        lines.append("🎉 SPECIAL OFFER: First 2 months at half price!")
+
+    print("\n".join(lines))
+
+def get_initial_description():
+    """Get initial 1-liner description from user"""
+    print("\nCan you give me a rough idea of what you're storing? Just one line is fine.")
+    print("Examples: 'boxes and a mattress' or 'a small motorbike and tools'")
+    
+    description = input("\nWhat are you storing? ").strip()
+    return description
+
+# Compiled once - splitting/quantity patterns for free-text descriptions
+_SPLIT_RE = re.compile(r'\s+(?:and|or|with|plus|including|,\s*|\+)\s+')
+_PART_QTY_RE = re.compile(r'(\d+)\s+(.+)')
+
+def analyze_initial_description(description):
+    """Analyze the initial description to extract items and check for issues"""
+    items = []
+    prohibited_items = []
+    description_lower = description.lower()
+
+    # Check for motor vehicles once against the whole description rather
+    # than re-scanning every part
+    vehicle_mentioned = _VEHICLE_RE.search(description_lower) is not None
+
+    # Simple parsing - split by common conjunctions and prepositions
+    parts = _SPLIT_RE.split(description_lower)
+
+    for part in parts:
+        part = part.strip()
+        if part:
+            # Try to extract quantity and item
+            # Look for patterns like "2 boxes", "1 sofa", "a mattress", etc.
+            quantity_match = _PART_QTY_RE.match(part)
+            if quantity_match:
+                quantity = int(quantity_match.group(1))
+                item = quantity_match.group(2)
+                items.append(f"{item} {quantity}")
+            else:
+                # No quantity specified, assume 1
+                items.append(f"{part} 1")
+    
+    return items, prohibited_items, vehicle_mentioned
+
+def get_items_for_storage():
+    print("\n📦 What are you looking to store?")
+    print("We need to make sure we're aware of all items.")
+    print("Examples: '2 sofas', '1 fridge freezer', '3 boxes', '1 car'")
+    print("Type 'done' when you've finished listing your items.")
+    
+    items = []
+    while True:
+        item = input(f"\nItem {len(items) + 1}: ").strip()
+        if item.lower() == 'done':
+            break
+        if item:
+            items.append(item)
+    
+    return items
+
+def check_prohibited_items(items, storage_type):
+    """Check for prohibited items based on storage type"""
+    # Use the matcher compiled for the appropriate prohibited items list
+    matcher = _PROHIBITED_RE["container" if storage_type == "container" else "internal"]
+    return [item for item in items if matcher.search(item.lower())]
+
+# Per-storage-type contract and booking details - table-driven so the
+# display code dispatches on one lookup instead of repeating branches
+STORAGE_TYPE_CONFIG = {
+    "container": {
+        "deposit": 120,
+        "padlock": 25,
+        "padlock_label": "Heavy-duty padlock",
+        "padlock_note": " (container-specific)",
+        "insurance_line": "• Insurance: £0.99 per £1k per week (advised) - Does not cover vehicles",
+        "extra_lines": (),
+        "booking_label": "Container booking",
+        "booking_url": "https://portaluk.storman.com/facility/OBRIC/unit-selection?env=uk",
+    },
+    "internal": {
+        "deposit": 50,
+        "padlock": 9.99,
+        "padlock_label": "Padlock",
+        "padlock_note": "",
+        "insurance_line": "• Insurance required: £0.99 per £1k per week - Does not cover vehicles",
+        "extra_lines": (
+            "• Liability: Goods stored at your sole risk",
+            "• Liability limit: £100",
+        ),
+        "booking_label": "Internal storage booking",
+        "booking_url": "https://portaluk.storman.com/facility/OBRIE/unit-selection?env=uk",
+    },
+}
+
+def display_contract_info(storage_type):
+    config = STORAGE_TYPE_CONFIG[storage_type]
+    lines = [
+        f"\n📋 CONTRACT INFORMATION",
+        f"{'='*50}",
+        "• Monthly renewable contracts",
+        "• Pay monthly in advance",
+        f"• £{config['deposit']} deposit (fully refundable)",
+        config['insurance_line'],
+        f"• {config['padlock_label']}: £{config['padlock']}{config['padlock_note']}",
+    ]
+    lines.extend(config['extra_lines'])
+    print("\n".join(lines))
+
+def display_results(site, storage_type, size, items, unrecognized_items, prohibited_items, customer_name):
+    print(f"\n{'='*60}")
+    print(f"📋 YOUR STORAGE RECOMMENDATION")
+    print(f"{'='*60}")
+    
+    print(f"📍 Location: {site.title()}")
+    print(f"🏢 Storage Type: {storage_type.title()}")
+    
+    if items:  # If they provided items, show the calculation
+        print(f"📦 Items: {', '.join(items)}")
+        print(f"📏 Estimated Size Needed: {size} sq ft")
+    else:  # If they chose a specific size
+        print(f"📏 Selected Size: {size} sq ft")
+    
+    # Get available sizes from API
+    available_sizes = get_available_sizes(site, storage_type)
+    
+    if not available_sizes:
+        print("⚠️  Currently no units available at this site.")
+        print("Please contact us directly for availability updates.")
+        return
+    
+    # Find suitable size
+    suitable_size = None
+    
+    # If we have items, find the next available size >= required size
+    # If we don't have items (multi-step selection), use the exact selected size
+    if items:
+        suitable_size = first_size_at_least(available_sizes, size)
+    else:
+        # Multi-step selection - use the exact selected size if it's available
+        if size in available_sizes:
+            suitable_size = size
+        else:
+            # Fallback to finding next available size
+            suitable_size = first_size_at_least(available_sizes, size)
+    
+    if suitable_size:
+        # Single lookup on the happy path - refetch once on a miss
+        try:
+            pricing = SITE_PRICING[site][storage_type][suitable_size]
+        except KeyError:
+            # Try to fetch pricing again
+            get_pricing_from_api(site, storage_type)
+            try:
+                pricing = SITE_PRICING[site][storage_type][suitable_size]
+            except KeyError:
+                pricing = None
+
+        if pricing is not None:
+            # Show pricing in a clean format
+            print(f"\n✅ RECOMMENDED SOLUTION:")
+            if storage_type == "container":
+                print(f"   {CONTAINER_SIZE_LABEL[suitable_size]}")
+            else:
+                print(f"   {suitable_size} sqft room (8ft tall)")
+
+            if storage_type == "internal":
+                # Show half-price for first 2 months, then regular price
+                half_weekly = pricing['weekly'] / 2
+                half_monthly = pricing['monthly'] / 2
+                print(f"   💰 £{half_weekly:.2f} per week inc VAT (£{half_monthly:.2f} per month) for the 1st 2 months")
+                print(f"   💰 £{pricing['weekly']} per week inc VAT (£{pricing['monthly']} per month) thereafter")
+            elif pricing.get("promo"):
+                # Show £18 per week for Wallsend containers with 2nd month free promotion
+                print(f"   💰 £18 per week inc VAT with 2nd month free promotion")
+                print(f"   💰 £{pricing['monthly']} per month")
+            else:
+                print(f"   💰 £{pricing['weekly']} per week inc VAT")
+                print(f"   💰 £{pricing['monthly']} per month")
+
+            # Show special offers
+            if pricing.get("promo"):
+                print(f"   🎉 SPECIAL: 2nd month free promotion - equates to £18 per week!")
+            elif storage_type == "internal":
+                print(f"   🎉 SPECIAL: First 2 months at half price!")
+
+        else:
+            print(f"⚠️  Size {suitable_size} sq ft available but pricing not available from API")
+            print(f"   Please contact us for current pricing: 0191 5372436")
+    else:
+        print(f"⚠️  No suitable size available for your needs ({size} sq ft)")
+        print("Available sizes:")
+        # site and storage_type are loop-invariant - pick the line
+        # formatter once instead of re-branching per size
+        if storage_type == "internal":
+            def fmt(s, p):
+                return (f"   • {s} sq ft - £{p['weekly'] / 2:.2f}/week (£{p['monthly'] / 2:.2f}/month) for 1st 2 months, "
+                        f"£{p['weekly']}/week (£{p['monthly']}/month) thereafter")
+        elif site == "wallsend":
+            def fmt(s, p):
+                if p.get("promo"):
+                    return f"   • {s} sq ft - £18/week with 2nd month free promotion (£{p['monthly']}/month)"
+                return f"   • {s} sq ft - £{p['weekly']}/week (£{p['monthly']}/month)"
+        else:
+            def fmt(s, p):
+                return f"   • {s} sq ft - £{p['weekly']}/week (£{p['monthly']}/month)"
+
+        # The site/type lookup is loop-invariant too - resolve it once
+        type_pricing = SITE_PRICING.get(site, {}).get(storage_type)
+        for available_size in available_sizes:
+            pricing = type_pricing.get(available_size) if type_pricing else None
+            if pricing is not None:
+                print(fmt(available_size, pricing))
+            elif type_pricing is not None:
+                print(f"   • {available_size} sq ft - pricing not available")
+            else:
+                print(f"   • {available_size} sq ft")
+        print("Please contact us to discuss alternatives.")
+    
+    if unrecognized_items:
+        print(f"\n⚠️  Note: Some items weren't recognized:")
+        for item in unrecognized_items:
+            print(f"   • {item}")
+        print("   (This may affect the size calculation)")
+    
+    if prohibited_items:
+        print(f"\n🚫 WARNING: Some items may be prohibited:")
+        for item in prohibited_items:
+            print(f"   • {item}")
+        print("   Please contact us for clarification.")
+    
+    # Check for sofa in internal storage
+    if storage_type == "internal" and items and any("sofa" in item.lower() for item in items):
+        print(f"\n📏 IMPORTANT: The lift is 2m x 2m")
+        print("   A typical 3-seater sofa may be too big for the lift.")
+        print("   Please measure your sofa before booking.")
+    
+    print(f"\n{'='*60}")
+    print("Ready to book? Choose an option:")
+    print("1. 🔗 Book now online")
+    print("2. 📞 Call us: 0191 5372436")
+    print("3. 📧 Email us: info@obrienselfstorage.co.uk")
+
+    # Get user choice
+    booking_choice = input("\nEnter your choice (1-3): ").strip()
+
+    if booking_choice == '1':
+        # Provide booking link
+        config = STORAGE_TYPE_CONFIG[storage_type]
+        print(f"🔗 {config['booking_label']}: {config['booking_url']}")
+        print("Opening booking link...")
+        webbrowser.open(config['booking_url'])
+    elif booking_choice == '2':
+        print("📞 Please call us on: 0191 5372436")
+        print("We're available Monday-Friday 8am-5pm")
+    elif booking_choice == '3':
+        print("📧 Please email us at: info@obrienselfstorage.co.uk")
+        print("We'll get back to you within 24 hours")
+    else:
+        print("❌ Invalid choice. Please contact us directly.")
+    
+    print(f"{'='*60}")
+
+def read_choice(prompt):
+    """Read one line of input normalised for matching - the strip/lower
+    chain lived at every prompt before, so the policy is now in one place"""
+    return input(prompt).strip().lower()
+
+def yn(prompt):
+    """Ask a y/n question - write the prompt and read one line directly,
+    skipping input()'s extra prompt/flush machinery. Only an exact 'y'
+    (any case) counts as yes, matching the previous checks"""
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    return line.strip().lower() == 'y'
+
+def display_menu(title, items):
+    """Print a numbered menu with a single write"""
+    print("\n".join([title] + [f"{i}. {item}" for i, item in enumerate(items, 1)]))
+
+def _read_choice(prompt, lo, hi):
+    """Read a numbered menu choice, returning None for bad input
+
+    str.isdigit screens non-numeric entries before int() so common
+    mistypes skip the exception machinery; out-of-range numbers also
+    return None."""
+    s = input(prompt).strip()
+    if s.isdigit():
+        n = int(s)
+        if lo <= n <= hi:
+            return n
+    return None
+
+def _pick_alt_container_site(available_sites, show_pricing=True):
+    """Print the scanned-sites listing and prompt for a site number
+
+    Shared by the vehicle-switch, waiting-list and prohibited-items
+    flows, which each carried their own copy of this ~25-line block.
+    Returns the chosen site_info dict, or None when the number is out
+    of range; non-numeric input raises ValueError so the callers'
+    existing handlers keep their messages."""
+    menu_lines = [
+        f"\n✅ Found {len(available_sites)} site(s) with available container units:",
+        "=" * 50,
+        "\n📍 Available Container Sites and Sizes:",
+    ]
+    for i, site_info in enumerate(available_sites, 1):
+        menu_lines.append(f"\n{i}. {site_info['site']} - Container Storage")
+        menu_lines.append("   Available sizes:")
+        for size in site_info['sizes']:
+            if not show_pricing:
+                menu_lines.append(f"      • {CONTAINER_SIZE_LABEL[size]}")
+            elif size in site_info['pricing']:
+                pricing = site_info['pricing'][size]
+                if pricing.get("promo"):
+                    menu_lines.append(f"      • {CONTAINER_SIZE_LABEL[size]} - £18/week with 2nd month free promotion")
+                else:
+                    menu_lines.append(f"      • {CONTAINER_SIZE_LABEL[size]} - £{pricing['weekly']}/week (£{pricing['monthly']}/month)")
+    menu_lines.append("\n" + "=" * 50)
+    menu_lines.append("Please select a site and size:")
+    print("\n".join(menu_lines))
+
+    site_choice = int(input("Enter site number: ").strip())
+    if 1 <= site_choice <= len(available_sites):
+        return available_sites[site_choice - 1]
+    return None
+
+def _choose_container_size(site_info):
+    """Menu of the chosen site's available sizes; prompt for a number
+
+    Returns the selected size bucket, or None (after telling the
+    customer) when the input is not a valid menu entry."""
+    size_options = site_info['sizes']
+    display_menu(f"\n📍 {site_info['site']} - Available Sizes:",
+                 [CONTAINER_SIZE_LABEL[s] for s in size_options])
+    try:
+        size_choice = int(input("Enter size number: ").strip())
+    except ValueError:
+        print("❌ Invalid size input. Continuing with original flow.")
+        return None
+    if 1 <= size_choice <= len(size_options):
+        return size_options[size_choice - 1]
+    print("❌ Invalid size choice. Continuing with original flow.")
+    return None
+
+
+# Dict-dispatched actions for the doesn't-fit retry menu - '1' retries a
+# larger size and '3'/anything else restarts, both via continue at the
+# call site, so only 'site' needs distinguishing
+_RETRY_ACTIONS = {"1": "size", "2": "site"}
+
+def _prompt_retry_choice():
+    """Menu shown when the chosen unit won't fit the customer's vehicle
+
+    Returns 'size' (try a larger unit), 'site' (try a different site)
+    or 'restart' (start over from the top of the session loop)."""
+    print("\n❌ No problem! Let's try a different size or site.")
+    print("Would you like to:")
+    print("1. Try a larger unit")
+    print("2. Try a different site")
+    print("3. Start over")
+    retry_choice = input("Enter your choice (1-3): ").strip()
+    return _RETRY_ACTIONS.get(retry_choice, "restart")
+
+def _prompt_next_action(site, storage_type):
+    """Run the what-next menu shown after a recommendation
+
+    Returns (action, new_size): action is 'restart' (go back to the top
+    of the session loop), 'exit' (leave the program) or 'stay' (fall
+    through with the current selection); new_size is set when the
+    customer re-picked a size. Dispatching on the returned action
+    replaces three duplicated deeply nested copies of this menu in
+    main()."""
+    print("\n".join([
+        f"\n{'='*60}",
+        "What would you like to do next?",
+        "1. 🔄 Re-choose site and size",
+        "2. ✅ Proceed with current selection",
+        "3. 🏠 Start over",
+        "4. 👋 Exit",
+    ]))
+
+    next_choice = input("\nEnter your choice (1-4): ").strip()
+
+    if next_choice == '1':
+        print("\n".join([
+            "\n🔄 Let's help you choose a different site or size.",
+            "Would you like to:",
+            "1. 📍 Choose a different site",
+            "2. 📏 Choose a different size",
+            "3. 🔙 Go back to current selection",
+        ]))
+
+        reselect_choice = input("Enter your choice (1-3): ").strip()
+
+        if reselect_choice == '1':
+            print("\n📍 Let's choose a different site...")
+            return 'restart', None
+        elif reselect_choice == '2':
+            print("\n📏 Let's choose a different size...")
+            # Get available sizes for current site
+            available_sizes = get_available_sizes(site, storage_type)
+            if available_sizes:
+                if storage_type == "container":
+                    size_labels = [CONTAINER_SIZE_LABEL[s] for s in available_sizes]
+                else:
+                    size_labels = [f"{s} sqft room" for s in available_sizes]
+                display_menu(f"\nAvailable sizes at {site.title()}:", size_labels)
+
+                new_size_choice = _read_choice("\nEnter size number: ", 1, len(available_sizes))
+                if new_size_choice is not None:
+                    new_size = available_sizes[new_size_choice - 1]
+                    print(f"✅ Updated size to {new_size} sqft")
+                    return 'restart', new_size
+                print("❌ Invalid size choice. Keeping current selection.")
+            else:
+                print("❌ No sizes available at this site.")
+        elif reselect_choice == '3':
+            print("✅ Keeping current selection.")
+        else:
+            print("❌ Invalid choice. Keeping current selection.")
+        return 'stay', None
+    elif next_choice == '2':
+        print("✅ Proceeding with current selection.")
+        return 'stay', None
+    elif next_choice == '3':
+        print("🔄 Starting over...")
+        return 'restart', None
+    elif next_choice == '4':
+        print("\n👋 Thanks for using O'Brien's Storage Finder!")
+        print("Have a great day!")
+        return 'exit', None
+    else:
+        print("❌ Invalid choice. Please try again.")
+        return 'restart', None
+
+def main():
+    # Block-buffer stdout so each batched menu goes out as one write
+    # instead of a flush per line; input() flushes the buffer before
+    # reading, so prompts still appear in order
+    try:
+        sys.stdout.reconfigure(line_buffering=False)
+    except (AttributeError, ValueError):
+        pass  # Not a reconfigurable stream (e.g. replaced stdout)
+
+    print_welcome()
+
+    # Warm the units and pricing caches in the background while the
+    # customer types - the API round-trips overlap with user input, so by
+    # the time a site is chosen the availability and pricing lookups are
+    # usually cache hits
+    threading.Thread(target=warm_caches, daemon=True).start()
+
+    # Capture customer information at the beginning
+    print("\n" + "="*60)
+    print("📋 CUSTOMER INFORMATION")
+    print("="*60)
+    customer_name = input("Please enter your name: ").strip()
+    customer_phone = input("Please enter your phone number: ").strip()
+    customer_email = input("Please enter your email address: ").strip()
+    
+    # Validate that we have at least a name
+    if not customer_name:
+        print("❌ Name is required. Please try again.")
+        return
+    
+    print(f"\n✅ Thank you, {customer_name}! Let's find you the perfect storage solution.")
+    
+    while True:
+        prohibited_items_handled = False  # Initialize flag at the start of each loop iteration
+        choice = get_initial_response()
+        
+        if choice == '2':
+            handle_account_inquiry()
+            if not yn("\nWould you like to find storage instead? (y/n): "):
+                print("\n👋 Thanks for using O'Brien's Storage Finder!")
+                print("Have a great day!")
+                break
+            continue
+            
+        elif choice == '3':
+            print("\n👋 Thanks for using O'Brien's Storage Finder!")
+            print("Have a great day!")
+            break
+        
+        # Storage finding - Main focus
+        # Find available storage units with real-time pricing and availability
+        
+        # Stage 1: Get initial description (1-liner)
+        initial_description = get_initial_description()
+        if not initial_description:
+            print("\n❌ No description provided. Please try again.")
+            continue
+        
+        # Analyze the description for items and issues
+        initial_items, initial_prohibited, vehicle_mentioned = analyze_initial_description(initial_description)
+        
+        # Stage 2: Get location
+        site = get_storage_site()
+        storage_type = get_storage_type(site)
+        
+        # Check for vehicle storage issues
+        if vehicle_mentioned and storage_type == "internal":
+            print("\n⚠️  IMPORTANT: Vehicles are not allowed in internal storage rooms.")
+            print("   You'll need to use container storage instead.")
+            print("   Would you like to switch to container storage?")
+            if yn("   Switch to container? (y/n): "):
+                storage_type = "container"
+                prohibited_items_handled = True  # Mark that we've handled vehicle/prohibited items
+                print("   ✅ Switched to container storage.")
+                
+                # Show all available container sites since vehicle requires container storage
+                print("\n🔍 Checking available container units across all sites...")
+                sys.stdout.flush()
+                # Check all sites for available container units
+                sites_to_check = ["wallsend", "boldon", "birtley", "sunderland", "chester-le-street"]
+                available_container_sites = _scan_container_sites(sites_to_check)
+                
+                if available_container_sites:
+                    try:
+                        selected_site_info = _pick_alt_container_site(available_container_sites)
+                        if selected_site_info is not None:
+                            selected_site = selected_site_info['site'].lower()
+                            selected_site_title = selected_site_info['site']
+                            
+                            # Update the site and storage_type variables
+                            site = selected_site
+                            storage_type = "container"
+                            
+                            # Get available sizes for the selected site
+                            available_sizes = selected_site_info['sizes']
+                            
+                            # Display site info first
+                            display_site_info(site, storage_type)
+                            
+                            # Add gap between USP and price
+                            print("\n" + "=" * 50)
+                            
+                            # Let user select a specific size
+                            size_options = available_sizes
+                            display_menu("Please select your preferred unit size:",
+                                         [CONTAINER_SIZE_LABEL[s] for s in size_options])
+                            
+                            try:
+                                size_choice = int(input("\nEnter size number: ").strip())
+                                if 1 <= size_choice <= len(size_options):
+                                    selected_size = size_options[size_choice - 1]
+                                    
+                                    # Display actual dimensions based on selected size
+                                    dimensions, size_name = SIZE_SPECS[selected_size]
+                                    
+                                    print(f"\n📏 Your selected {size_name} unit dimensions: {dimensions} feet")
+                                    print("(Internal dimensions may vary by approximately 8 inches)")
+                                    
+                                    # Ask if vehicle fits
+                                    if yn("\nWould your vehicle fit? (y/n): "):
+                                        print(f"\n✅ Perfect! Let's show you the pricing for your {size_name} unit.")
+                                        
+                                        # Display pricing for the selected size only
+                                        print(f"\n✅ Pricing for {size_name} unit ({dimensions}):")
+                                        pricing = SITE_PRICING[site]['container'][selected_size]
+                                        if pricing.get("promo"):
+                                            print(f"• {CONTAINER_SIZE_LABEL[selected_size]} - £18 a week inc VAT with 2nd month free promotion (£{pricing['monthly']} per month)")
+                                        else:
+                                            print(f"• {CONTAINER_SIZE_LABEL[selected_size]} - £{pricing['weekly']} a week inc VAT (£{pricing['monthly']} per month)")
+                                        
+                                        if site == "wallsend":
+                                            print("\n🎉 SPECIAL OFFER: 2nd month free promotion - equates to £18 per week!")
+                                        
+                                        # Display results with booking options
+                                        display_results(site, storage_type, selected_size, [], [], [], customer_name)
+                                        
+                                        # Ask if they want to re-choose site/size or continue
+                                        action, new_size = _prompt_next_action(site, storage_type)
+                                        if new_size is not None:
+                                            selected_size = new_size
+                                        if action == 'exit':
+                                            break
+                                        if action == 'restart':
+                                            continue
+                                    else:
+                                        if _prompt_retry_choice() == 'site':
+                                            break  # This will restart the site selection
+                                        continue  # Larger unit or start over both loop back round
+                                else:
+                                    print("❌ Invalid size selection. Please try again.")
+                                    continue
+                            except ValueError:
+                                print("❌ Please enter a valid number.")
+                                continue
+                        else:
+                            print("❌ Invalid selection. Please try again.")
+                            continue
+                    except ValueError:
+                        print("❌ Please enter a valid number.")
+                        continue
+                else:
+                    print("⚠️  No container units currently available at any site.")
+                    print("Please contact us directly for availability updates.")
+                    continue
+            else:
+                print("   ❌ Vehicle storage not available in internal rooms.")
+                print("   Please contact us for assistance.")
+                continue
+        
+        # Handle special cases (but skip if we've already handled prohibited items)
+        if site == "sunderland" and storage_type == "container" and not prohibited_items_handled:
+            print("\n⚠️  Sunderland containers currently have a waiting list.")
+            print("Please leave your name and number and we'll contact you.")
+            name = input("Name: ").strip()
+            number = input("Phone number: ").strip()
+            print("Thank you! We'll be in touch soon.")
+            
+            # Offer to show available sites with units
+            print("\nWould you like to see other sites with available units?")
+            if yn("Show available sites? (y/n): "):
+                print("\n🔍 Checking available units across all sites...")
+                sys.stdout.flush()
+                # Check all sites for available units
+                sites_to_check = ["wallsend", "boldon", "birtley", "sunderland"]
+                available_sites = _scan_container_sites(sites_to_check)
+                
+                if available_sites:
+                    try:
+                        selected_site_info = _pick_alt_container_site(available_sites, show_pricing=False)
+                        if selected_site_info is not None:
+                            selected_site = selected_site_info['site'].lower()
+                            selected_site_title = selected_site_info['site']
+                            
+                            selected_size = _choose_container_size(selected_site_info)
+                            if selected_size is not None:
+                                site = selected_site
+                                storage_type = "container"  # Update storage type to container
+                                print(f"✅ Selected {selected_site_title} - {selected_size} sqft")
+                                
+                                # Step 3: Show USPs for the selected site
+                                print("\n" + "=" * 50)
+                                display_site_info(site, "container")
+                                
+                                # Add gap between USP and price
+                                print("\n" + "=" * 50)
+                                
+                                # Display actual dimensions based on selected size
+                                dimensions, size_name = SIZE_SPECS[selected_size]
+                                
+                                print(f"\n📏 Your selected {size_name} unit dimensions: {dimensions} feet")
+                                print("(Internal dimensions may vary by approximately 8 inches)")
+                                
+                                # Ask if vehicle fits
+                                if yn("\nWould your vehicle fit? (y/n): "):
+                                    print(f"\n✅ Perfect! Let's show you the pricing for your {size_name} unit.")
+                                    
+                                    # Step 4: Show pricing for the selected size
+                                    # - one dict probe, one write
+                                    pricing_lines = [f"\n💰 Pricing for {size_name} unit ({dimensions}):"]
+                                    pricing = selected_site_info['pricing'].get(selected_size)
+                                    if pricing is not None:
+                                        if pricing.get("promo"):
+                                            pricing_lines += [
+                                                f"   💰 £18 per week inc VAT with 2nd month free promotion",
+                                                f"   💰 £{pricing['monthly']} per month",
+                                                f"   🎉 SPECIAL: 2nd month free promotion - equates to £18 per week!",
+                                            ]
+                                        else:
+                                            pricing_lines += [
+                                                f"   💰 £{pricing['weekly']} per week inc VAT",
+                                                f"   💰 £{pricing['monthly']} per month",
+                                            ]
+                                    print("\n".join(pricing_lines))
+                                    
+                                    # Display contract info
+                                    display_contract_info(storage_type)
+                                    
+                                    # Show booking link
+                                    print(f"\n🔗 Book now: https://portaluk.storman.com/facility/OBRIC/unit-selection?env=uk")
+                                    
+                                    # Final summary
+                                    print(SUMMARY_TEMPLATE.format(site=selected_site_title,
+                                                                  size_name=size_name,
+                                                                  dimensions=dimensions))
+                                    return
+                                else:
+                                    if _prompt_retry_choice() == 'site':
+                                        break  # This will restart the site selection
+                                    continue  # Larger unit or start over both loop back round
+                        else:
+                            print("❌ Invalid site choice. Continuing with original flow.")
+                    except ValueError:
+                        print("❌ Invalid site input. Continuing with original flow.")
+                else:
+                    print("\n❌ No other sites currently have available units.")
+                    print("We'll contact you as soon as units become available at Sunderland.")
+                    continue
+            continue
+        
+        # Check if units are available (but don't show pricing yet)
+        available_sizes = get_available_sizes(site, storage_type)
+        if not available_sizes:
+            print("⚠️  Currently no units available at this site.")
+            print("Please contact us directly for availability updates.")
+            if not yn("\nWould you like to check another site? (y/n): "):
+                print("\n👋 Thanks for using O'Brien's Storage Finder!")
+                print("Have a great day!")
+                break
+            continue
+        
+        # Show site information (features, not pricing)
+        display_site_info(site, storage_type)
+        
+        # Ask if they know what they need or want recommendation
+        customer_choice = get_customer_choice(storage_type)
+        
+        if customer_choice == '1':
+            # They know what size they need
+            size = get_known_size(site, storage_type)
+            if size is None:  # No units available
+                if not yn("\nWould you like to check another site? (y/n): "):
+                    print("\n👋 Thanks for using O'Brien's Storage Finder!")
+                    print("Have a great day!")
+                    break
+                continue
+            items = []
+            unrecognized_items = []
+            prohibited_items = []
+        else:
+            # They need recommendation based on items
+            items = get_items_for_storage()
+            if not items:
+                print("\n❌ No items entered. Please try again.")
+                continue
+            
+            # Calculate size
+            size, unrecognized_items = calculate_size_from_items(items)
+            
+            # Check for prohibited items (only for internal storage)
+            if storage_type == "internal":
+                prohibited_items = check_prohibited_items(items, storage_type)
+            else:
+                prohibited_items = []
+        
+        # Handle prohibited items in internal storage by offering container alternatives
+        if storage_type == "internal" and prohibited_items:
+            print(f"\n🚫 WARNING: Some items may be prohibited in internal storage:")
+            for item in prohibited_items:
+                print(f"   • {item}")
+            print("\n💡 SOLUTION: Container storage allows these items!")
+            print("Would you like to see available container options?")
+            
+            if yn("Show container alternatives? (y/n): "):
+                print("\n🔍 Checking available container units across all sites...")
+                sys.stdout.flush()
+                # Check all sites for available container units
+                sites_to_check = ["wallsend", "boldon", "birtley", "sunderland", "chester-le-street"]
+                available_container_sites = _scan_container_sites(sites_to_check)
+                
+                if available_container_sites:
+                    try:
+                        selected_site_info = _pick_alt_container_site(available_container_sites)
+                        if selected_site_info is not None:
+                            selected_site = selected_site_info['site'].lower()
+                            selected_site_title = selected_site_info['site']
+                            
+                            selected_size = _choose_container_size(selected_site_info)
+                            if selected_size is not None:
+                                site = selected_site
+                                storage_type = "container"  # Switch to container storage
+                                print(f"✅ Selected {selected_site_title} - {selected_size} sqft container")
+                                
+                                # Show container USPs
+                                print("\n" + "=" * 50)
+                                display_site_info(site, "container")
+                                
+                                # Show pricing for the selected size - one
+                                # dict probe, one write
+                                pricing_lines = [f"\n💰 Pricing for {selected_size} sqft container:"]
+                                pricing = selected_site_info['pricing'].get(selected_size)
+                                if pricing is not None:
+                                    if pricing.get("promo"):
+                                        pricing_lines += [
+                                            f"   💰 £18 per week inc VAT with 2nd month free promotion",
+                                            f"   💰 £{pricing['monthly']} per month",
+                                            f"   🎉 SPECIAL: 2nd month free promotion - equates to £18 per week!",
+                                        ]
+                                    else:
+                                        pricing_lines += [
+                                            f"   💰 £{pricing['weekly']} per week inc VAT",
+                                            f"   💰 £{pricing['monthly']} per month",
+                                        ]
+                                print("\n".join(pricing_lines))
+                                
+                                # Display results with booking options
+                                display_results(site, storage_type, selected_size, [], [], [], customer_name)
+                                
+                                # Continue with the rest of the flow
+                                print("\n" + "=" * 50)
+                                print("Would you like to proceed with this selection?")
+                                if not yn("Continue? (y/n): "):
+                                    print("❌ Returning to main menu.")
+                                    continue
+                                
+                                # Set the size and skip item collection since we already have a selection
+                                size = selected_size
+                                items = []
+                                unrecognized_items = []
+                                prohibited_items = []  # Reset since we're now using containers
+                                prohibited_items_handled = True  # Mark that we've handled prohibited items
+                                
+                                # Skip to display results and bypass waiting list logic
+                                display_results(site, storage_type, size, items, unrecognized_items, prohibited_items, customer_name)
+                                display_contract_info(storage_type)
+                                
+                                # Ask if they want to re-choose site/size or continue
+                                action, new_size = _prompt_next_action(site, storage_type)
+                                if new_size is not None:
+                                    size = new_size
+                                if action == 'exit':
+                                    break
+                                if action == 'restart':
+                                    continue
+                                
+                                # Ask if they want to continue with another option
+                                if not yn("\nWould you like to check another option? (y/n): "):
+                                    print("\n👋 Thanks for using O'Brien's Storage Finder!")
+                                    print("Have a great day!")
+                                    break
+                                continue
+                        else:
+                            print("❌ Invalid site choice. Continuing with original flow.")
+                    except ValueError:
+                        print("❌ Invalid site input. Continuing with original flow.")
+                else:
+                    print("\n❌ No container units currently available at any site.")
+                    print("Please contact us for assistance.")
+                    continue
+            else:
+                print("❌ Prohibited items cannot be stored in internal storage.")
+                print("Please contact us for assistance.")
+                continue
+        
+        # Display results with pricing
+        display_results(site, storage_type, size, items, unrecognized_items, prohibited_items, customer_name)
+        
+        # Show contract info
+        display_contract_info(storage_type)
+        
+        # Ask if they want to re-choose site/size or continue
+        action, new_size = _prompt_next_action(site, storage_type)
+        if new_size is not None:
+            size = new_size
+        if action == 'exit':
+            break
+        if action == 'restart':
+            continue
+        
+        # Ask if they want to continue with another option
+        if not yn("\nWould you like to check another option? (y/n): "):
+            print("\n👋 Thanks for using O'Brien's Storage Finder!")
+            print("Have a great day!")
+            break
+
+if __name__ == '__main__':
+    main() 
\ No newline at end of file